@@ -0,0 +1,106 @@
+# /workspace/file-scripts/tools/config_browser.py
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from rich.console import Console
+from rich.panel import Panel
+from rich.columns import Columns
+
+from .json_io import read_json
+
+@lru_cache(maxsize=1)
+def _build_listing(config_path: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Dict[str, Tuple[str, ...]], Tuple[Panel, ...]]:
+    """Scan config folders and build their panels; cached until the directory changes."""
+    with os.scandir(config_path) as entries:
+        folders = [entry.name for entry in entries
+                   if entry.is_dir() and entry.name != 'templates'
+                   and not entry.name.startswith('.ipynb_checkpoints')]
+
+    grouped = {}
+    ordered_folders = []
+    panels = []
+    index = 1
+
+    for folder in folders:
+        base_name = folder.split('-', 1)[0]
+        grouped.setdefault(base_name, []).append(folder)
+
+    for base_name in sorted(grouped.keys()):
+        content = []
+        names_in_group = tuple(sorted(grouped[base_name], key=str.lower, reverse=True))
+        grouped[base_name] = names_in_group
+
+        # Add "process all" option for each group
+        content.append(f"[yellow]{index}.[/yellow] all")
+        ordered_folders.append(f"{base_name}:all")
+        index += 1
+
+        # Add individual folders
+        for name in names_in_group:
+            content.append(f"[yellow]{index}.[/yellow] {name}")
+            ordered_folders.append(name)
+            index += 1
+
+        panel = Panel(
+            "\n".join(content),
+            title=f"[yellow]{base_name}[/yellow]",
+            border_style="blue",
+            width=40
+        )
+        panels.append(panel)
+
+    return tuple(ordered_folders), grouped, tuple(panels)
+
+@lru_cache(maxsize=128)
+def _parse_backend(backend_path: str, mtime_ns: int) -> Optional[str]:
+    """Return the first instance_data_dir in a backend file; cached until the file changes."""
+    data = read_json(backend_path)
+    for item in data:
+        if isinstance(item, dict) and 'instance_data_dir' in item:
+            return item['instance_data_dir']
+    return None
+
+class ConfigBrowser:
+    """Config folder listing and dataset lookup shared by the dataset tools."""
+
+    def __init__(self):
+        self.console = Console()
+        self.config_path = Path('/workspace/SimpleTuner/config')
+        self.datasets_path = Path('/workspace/SimpleTuner/datasets')
+        # Piped/scripted runs get a plain numbered list instead of panels
+        self.interactive = self.console.is_terminal
+
+    def list_config_folders(self) -> Tuple[List[str], Dict[str, Tuple[str, ...]]]:
+        """List configuration folders grouped by base name.
+
+        Returns the display order and the folders of each group, so a
+        "base:all" selection can be expanded without rescanning the list.
+        """
+        ordered_folders, grouped, panels = _build_listing(
+            str(self.config_path), self.config_path.stat().st_mtime_ns
+        )
+
+        if self.interactive:
+            for i in range(0, len(panels), 3):
+                row_panels = panels[i:i + 3]
+                self.console.print(Columns(row_panels, equal=True, expand=True))
+        else:
+            for i, name in enumerate(ordered_folders, 1):
+                print(f"{i}. {name}")
+
+        return list(ordered_folders), grouped
+
+    def get_dataset_path(self, config_dir: Path) -> Optional[Path]:
+        """Extract dataset path from multidatabackend.json."""
+        backend_file = config_dir / "multidatabackend.json"
+        try:
+            instance_data_dir = _parse_backend(
+                str(backend_file), backend_file.stat().st_mtime_ns
+            )
+            if instance_data_dir is not None:
+                return self.datasets_path / instance_data_dir.split('/')[-1]
+        except Exception as e:
+            self.console.print(f"[red]Error reading dataset path: {str(e)}[/red]")
+        return None
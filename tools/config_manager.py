@@ -1,12 +1,16 @@
 import os
+import re
 import json
+import codecs
+import mmap
+import select
 import shutil
 import time
 import sys
-import tty
-import termios
 from contextlib import contextmanager
-from typing import Dict, Any, Optional, List, Tuple, Union
+from functools import lru_cache
+from itertools import groupby, zip_longest
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union
 from pathlib import Path
 
 from rich.console import Console
@@ -14,11 +18,127 @@
 from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
+from rich.layout import Layout
+from rich.live import Live
 from rich.prompt import Prompt
+from rich.text import Text
 from rich import print as rprint
 
 import tiktoken
 
+from .json_io import loads, read_json, write_json
+
+TOKEN_PLACEHOLDER_PATTERN = re.compile(r'__TOKEN_NAME__|_TOKEN_NAME_')
+CONFIG_PLACEHOLDER_PATTERN = re.compile(rb'__TOKEN_NAME__|__TOKEN_NAME_VERSION__|__VERSION_NUMBER__')
+INSTANCE_DATA_DIR_PATTERN = re.compile(rb'"instance_data_dir"\s*:\s*"((?:[^"\\]|\\.)+)"')
+VALID_NAME_PATTERN = re.compile(r'[\w-]+')
+CLEAR_CMD = 'clear' if os.name == 'posix' else 'cls'
+IS_WINDOWS = sys.platform.startswith('win')
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+# _IOW(0x94, 9, int): clone a whole file as a copy-on-write reflink (btrfs/xfs)
+FICLONE = 0x40049409
+
+@lru_cache(maxsize=None)
+def _literal_pattern(text: str) -> re.Pattern:
+    """Compile (and cache) a pattern matching a literal token."""
+    return re.compile(re.escape(text))
+
+def _base_name(name: str) -> str:
+    """Return the token prefix of a folder name (the part before the first dash)."""
+    i = name.find('-')
+    return name if i < 0 else name[:i]
+
+def _json_escape(text: str) -> str:
+    """Return text encoded as the inside of a JSON string literal."""
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+@lru_cache(maxsize=None)
+def _version_pattern(token_name: str, old_version: str) -> re.Pattern:
+    """Compile (and cache) a pattern matching token-old_version and token/old_version."""
+    return re.compile(re.escape(token_name.encode('utf-8')) + rb'([-/])' + re.escape(old_version.encode('utf-8')))
+
+@contextmanager
+def read_buffer(path: Union[str, Path]):
+    """Yield a file's contents as bytes, memory-mapped when the file is large."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def copy_file(src: str, dst: str, size: int) -> None:
+    """Copy file contents, preferring a reflink, then an in-kernel copy."""
+    # Opening dst truncates it, so copying a file onto itself would empty it
+    try:
+        same = os.path.samefile(src, dst)
+    except OSError:
+        same = False
+    if same:
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        try:
+            import fcntl
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return
+        except (ImportError, OSError):
+            pass
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                # Some filesystems return 0 without copying anything; like
+                # shutil, finish those in userspace
+                if remaining < size or size == 0:
+                    return
+            except OSError:
+                # Not supported between these filesystems; start over in userspace
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+
+        shutil.copyfileobj(fsrc, fdst)
+
+def copy_tree(src: Path, dst: Path) -> None:
+    """Recursively copy src into dst, merging with anything already there."""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                copy_tree(entry.path, target)
+                continue
+            copy_file(entry.path, target, entry.stat().st_size)
+            shutil.copystat(entry.path, target)
+
+# Pick the single-key reader for this platform once, at import time
+if IS_WINDOWS:
+    import msvcrt
+
+    def _getch() -> str:
+        return msvcrt.getch().decode('utf-8')
+else:
+    import tty
+    import termios
+
+    def _getch() -> str:
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            ch = sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        return ch
+
 ###############################################
 # Part 1: ConfigManager (from the third snippet)
 ###############################################
@@ -28,17 +148,24 @@ def __init__(self):
         self.console = Console()
         self.templates_path = Path('/workspace/SimpleTuner/config/templates')
         self.root_path = Path('/workspace/SimpleTuner/config')
+        self.datasets_path = self.root_path.parent / 'datasets'
+        # Directory scans are cached for the lifetime of the manager
+        self._folders_cache: Optional[List[str]] = None
+        self._templates_cache: Optional[List[str]] = None
+        self._datasets_cache: Optional[List[str]] = None
         
     def verify_paths(self) -> bool:
         required_paths = {
             'config': self.root_path,
             'templates': self.templates_path,
-            'datasets': self.root_path.parent / 'datasets'
+            'datasets': self.datasets_path
         }
         
         missing = []
         for name, path in required_paths.items():
-            if not path.exists():
+            try:
+                os.stat(path)
+            except OSError:
                 missing.append(f"{name}: {path}")
                 
         if missing:
@@ -50,39 +177,36 @@ def verify_paths(self) -> bool:
         return True
         
     def clear_screen(self):
-        os.system('clear' if os.name == 'posix' else 'cls')
+        os.system(CLEAR_CMD)
 
-    def show_rainbow_progress(self, description: str) -> None:
-        with Progress(
+    def make_progress(self) -> Progress:
+        return Progress(
             TextColumn("[bold blue]{task.description}"),
             BarColumn(complete_style="green"),
             TaskProgressColumn(),
             console=self.console,
             transient=True
-        ) as progress:
-            task = progress.add_task(description, total=100)
-            while not progress.finished:
-                progress.update(task, advance=1)
-                time.sleep(0.02)
-
-    def getch(self):
-        if sys.platform.startswith('win'):
-            import msvcrt
-            return msvcrt.getch().decode('utf-8')
-        else:
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setraw(fd)
-                ch = sys.stdin.read(1)
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-            return ch
+        )
+
+    getch = staticmethod(_getch)
 
     def get_yes_no_input(self, prompt_text: str) -> str:
         print(f"{prompt_text} [y/n]: ", end='', flush=True)
+        if IS_WINDOWS:
+            return self._read_yes_no(prompt_text, self.getch)
+
+        # Stay in cbreak mode for the whole prompt rather than per keystroke
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            return self._read_yes_no(prompt_text, lambda: os.read(fd, 1).decode('utf-8', 'ignore'))
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+    def _read_yes_no(self, prompt_text: str, read_char: Callable[[], str]) -> str:
         while True:
-            ch = self.getch()
+            ch = read_char()
             if ch.lower() in ('y', 'n'):
                 print(ch)
                 return ch.lower()
@@ -90,39 +214,73 @@ def get_yes_no_input(self, prompt_text: str) -> str:
                 print("\n[red]Invalid input. Please enter 'y' or 'n'.[/red]")
                 print(f"{prompt_text} [y/n]: ", end='', flush=True)
 
-    def list_folders(self) -> list:
-        folders = [f for f in self.root_path.iterdir() 
-                   if f.is_dir() and f.name not in ['templates', '.ipynb_checkpoints']]
-        
-        grouped = {}
-        ordered_folders = []
+    def _scan_subdirs(self, path: Path, exclude: Tuple[str, ...]) -> List[str]:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries
+                    if entry.is_dir() and entry.name not in exclude]
+
+    def _scan_folders(self) -> List[str]:
+        if self._folders_cache is None:
+            self._folders_cache = self._scan_subdirs(self.root_path, ('templates', '.ipynb_checkpoints'))
+        return self._folders_cache
+
+    def _scan_templates(self) -> List[str]:
+        if self._templates_cache is None:
+            self._templates_cache = self._scan_subdirs(self.templates_path, ('.ipynb_checkpoints',))
+        return self._templates_cache
+
+    def _scan_datasets(self) -> List[str]:
+        if self._datasets_cache is None:
+            self._datasets_cache = self._scan_subdirs(self.datasets_path, ('.ipynb_checkpoints',))
+        return self._datasets_cache
+
+    def _ordered_names(self, names: List[str]) -> List[str]:
+        """Order names by token prefix, newest-looking name first within each prefix."""
+        # Both sorts are stable, so the second keeps the first's order within a prefix
+        return sorted(sorted(names, key=str.lower, reverse=True), key=_base_name)
+
+    def _collect_folders(self) -> List[str]:
+        return self._ordered_names(self._scan_folders())
+
+    def _collect_templates(self) -> List[str]:
+        return self._ordered_names(self._scan_templates())
+
+    def _collect_datasets(self) -> List[str]:
+        return self._ordered_names(self._scan_datasets())
+
+    def _render_groups(self, ordered_names: List[str]) -> None:
+        """Print ordered names as numbered panels, one panel per token prefix."""
         panels = []
         index = 1
-        
-        for folder in folders:
-            base_name = folder.name.split('-', 1)[0]
-            grouped.setdefault(base_name, []).append(folder.name)
-        
-        for base_name in sorted(grouped.keys()):
+        for base_name, names_in_group in groupby(ordered_names, key=_base_name):
             table = Table(show_header=False, show_edge=False, box=None, padding=(0,1))
             table.add_column(justify="left", no_wrap=False, overflow='fold', max_width=30)
-            names_in_group = sorted(grouped[base_name], key=str.lower, reverse=True)
             for name in names_in_group:
                 table.add_row(f"[yellow]{index}. {name}[/yellow]")
-                ordered_folders.append(name)
                 index += 1
                 
             panel = Panel(table, title=f"[magenta]{base_name}[/magenta]", 
                           border_style="blue", width=36)
             panels.append(panel)
         
+        if not panels:
+            return
+
+        # Lay every row out in one grid so the listing is measured and printed once
         panels_per_row = 3
+        grid = Table.grid(expand=True)
+        for _ in range(panels_per_row):
+            grid.add_column(ratio=1)
         for i in range(0, len(panels), panels_per_row):
             row_panels = panels[i:i + panels_per_row]
             while len(row_panels) < panels_per_row:
                 row_panels.append(Panel("", border_style="blue", width=36))
-            self.console.print(Columns(row_panels, equal=True, expand=True))
-            
+            grid.add_row(*row_panels)
+        self.console.print(grid)
+
+    def list_folders(self) -> list:
+        ordered_folders = self._collect_folders()
+        self._render_groups(ordered_folders)
         return ordered_folders
         
     def list_templates(self) -> list:
@@ -130,177 +288,127 @@ def list_templates(self) -> list:
             rprint(f"[yellow]Warning: Templates directory {self.templates_path} not found.[/yellow]")
             return []
 
-        templates = [f for f in self.templates_path.iterdir() 
-                     if f.is_dir() and f.name != '.ipynb_checkpoints']
-        
-        grouped = {}
-        ordered_templates = []
-        index = 1
-        
-        for template in templates:
-            base_name = template.name.split('-', 1)[0]
-            grouped.setdefault(base_name, []).append(template.name)
-            ordered_templates.append(template.name)
-
-        panels = []
-        for base_name in sorted(grouped.keys()):
-            table = Table(show_header=False, show_edge=False, box=None, padding=(0,1))
-            table.add_column(justify="left", no_wrap=False, overflow='fold', max_width=30)
-            
-            names_in_group = sorted(grouped[base_name], key=str.lower, reverse=True)
-            for name in names_in_group:
-                table.add_row(f"[yellow]{index}. {name}[/yellow]")
-                index += 1
-                
-            panel = Panel(table, title=f"[magenta]{base_name}[/magenta]", 
-                          border_style="blue", width=36)
-            panels.append(panel)
-
-        panels_per_row = 3
-        for i in range(0, len(panels), panels_per_row):
-            row_panels = panels[i:i + panels_per_row]
-            while len(row_panels) < panels_per_row:
-                row_panels.append(Panel("", border_style="blue", width=36))
-            self.console.print(Columns(row_panels, equal=True, expand=True))
-        
+        ordered_templates = self._collect_templates()
+        self._render_groups(ordered_templates)
         return ordered_templates
 
     def list_datasets(self) -> list:
-        datasets_path = self.root_path.parent / 'datasets'
-        if not datasets_path.exists():
-            rprint(f"[yellow]Warning: Datasets directory {datasets_path} not found.[/yellow]")
+        if not self.datasets_path.exists():
+            rprint(f"[yellow]Warning: Datasets directory {self.datasets_path} not found.[/yellow]")
             return []
             
-        datasets = [folder.name for folder in datasets_path.iterdir() 
-                    if folder.is_dir() and folder.name != '.ipynb_checkpoints']
-        
-        grouped = {}
-        ordered_datasets = []
-        index = 1
-        
-        for dataset in sorted(datasets):
-            base_name = dataset.split('-', 1)[0]
-            grouped.setdefault(base_name, []).append(dataset)
-            ordered_datasets.append(dataset)
-    
-        panels = []
-        for base_name in sorted(grouped.keys()):
-            table = Table(show_header=False, show_edge=False, box=None, padding=(0,1))
-            table.add_column(justify="left", no_wrap=False, overflow='fold', max_width=30)
-            
-            names_in_group = sorted(grouped[base_name], key=str.lower, reverse=True)
-            for name in names_in_group:
-                table.add_row(f"[yellow]{index}. {name}[/yellow]")
-                index += 1
-                    
-            panel = Panel(table, title=f"[magenta]{base_name}[/magenta]", 
-                          border_style="blue", width=36)
-            panels.append(panel)
-    
-        panels_per_row = 3
-        for i in range(0, len(panels), panels_per_row):
-            row_panels = panels[i:i + panels_per_row]
-            while len(row_panels) < panels_per_row:
-                row_panels.append(Panel("", border_style="blue", width=36))
-            self.console.print(Columns(row_panels, equal=True, expand=True))
-        
+        ordered_datasets = self._collect_datasets()
+        self._render_groups(ordered_datasets)
         return ordered_datasets
 
     def parse_folder_name(self, folder: str) -> Tuple[str, str]:
-        parts = folder.split('-', 1)
-        return parts[0], parts[1] if len(parts) > 1 else ''
-
-    def process_config_json(self, filepath: Path, token_name: str, new_version: str, old_version: Optional[str] = None) -> None:
-        try:
-            with open(filepath, 'r') as f:
-                content = f.read()
-
-            if old_version:
-                content = content.replace(f"{token_name}-{old_version}", f"{token_name}-{new_version}")
-                content = content.replace(f"{token_name}/{old_version}", f"{token_name}/{new_version}")
-            else:
-                replacements = {
-                    '__TOKEN_NAME__': token_name,
-                    '__TOKEN_NAME_VERSION__': f"{token_name}-{new_version}",
-                    '__VERSION_NUMBER__': new_version,
-                }
-                for old, new in replacements.items():
-                    content = content.replace(old, new)
+        i = folder.find('-')
+        return (folder, '') if i < 0 else (folder[:i], folder[i + 1:])
+
+    def read_dataset_dir(self, backend_file: Path) -> Optional[str]:
+        """Return the first instance_data_dir basename from a multidatabackend.json."""
+        with open(backend_file, 'rb') as f:
+            buf = f.read()
+
+        match = INSTANCE_DATA_DIR_PATTERN.search(buf)
+        if match:
+            raw = match.group(1)
+            # Only escaped strings need the JSON decoder
+            value = json.loads(b'"' + raw + b'"') if b'\\' in raw else raw.decode('utf-8')
+            return value.rsplit('/', 1)[-1]
+
+        # Fall back to a real parser for anything the scan can't handle
+        data = loads(buf)
+        return next(
+            (obj['instance_data_dir'].split('/')[-1]
+             for obj in data if isinstance(obj, dict) and 'instance_data_dir' in obj),
+            None
+        )
 
-            with open(filepath, 'w') as f:
-                f.write(content)
-                
-        except Exception as e:
-            rprint(f"[red]Error processing config.json: {str(e)}[/red]")
+    def transform_config_json(self, content: bytes, token_name: str, new_version: str, old_version: Optional[str] = None) -> bytes:
+        """Rewrite config.json bytes; content may be any buffer, including an mmap."""
+        token = token_name.encode('utf-8')
+        version = new_version.encode('utf-8')
+        if old_version:
+            return _version_pattern(token_name, old_version).sub(
+                lambda m: token + m.group(1) + version, content
+            )
 
-    def process_user_prompt_library(self, filepath: Path, token_name: str, existing_token: Optional[str] = None) -> None:
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+        replacements = {
+            b'__TOKEN_NAME__': token,
+            b'__TOKEN_NAME_VERSION__': token + b'-' + version,
+            b'__VERSION_NUMBER__': version,
+        }
+        return CONFIG_PLACEHOLDER_PATTERN.sub(lambda m: replacements[m.group(0)], content)
+
+    def transform_user_prompt_library(self, content: str, token_name: str, existing_token: Optional[str] = None) -> str:
+        if existing_token and existing_token == token_name:
+            return content
+
+        # Substitute on the raw JSON text; the replacement is JSON-escaped,
+        # so the document stays valid without a parse/serialize round-trip
+        pattern = _literal_pattern(_json_escape(existing_token)) if existing_token else TOKEN_PLACEHOLDER_PATTERN
+        replacement = _json_escape(token_name)
+        return pattern.sub(lambda m: replacement, content)
+
+    def transform_multidatabackend(self, content: str, token_name: str, dataset_name: str) -> str:
+        data = loads(content)
+
+        cache_dir_name = f"{token_name}-{dataset_name}"
+        for item in data:
+            if isinstance(item, dict):
+                if 'instance_data_dir' in item:
+                    item['instance_data_dir'] = f"datasets/{dataset_name}"
+                if 'cache_dir_vae' in item:
+                    item['cache_dir_vae'] = f"cache/vae/{cache_dir_name}/{item.get('id', '')}"
+                elif item.get('id') == 'text_embeds':
+                    item['cache_dir'] = f"cache/text/{cache_dir_name}"
+                    item.pop('instance_data_dir', None)
+                    item.pop('cache_dir_vae', None)
+
+        return json.dumps(data, indent=2)
+
+    def copy_and_transform(self, source_path: Path, target_dir: Path, token_name: str, new_version: str,
+                           dataset_dir: str, old_version: Optional[str] = None) -> None:
+        """Copy source_path into target_dir, rewriting the config files on the way through."""
+        existing_token = token_name if old_version else None
+        # Each transform takes the source buffer and returns the bytes to write
+        transforms = {
+            'config.json': lambda buf: self.transform_config_json(buf, token_name, new_version, old_version),
+            'user_prompt_library.json': lambda buf: self.transform_user_prompt_library(
+                bytes(buf).decode('utf-8'), token_name, existing_token).encode('utf-8'),
+            'multidatabackend.json': lambda buf: self.transform_multidatabackend(
+                bytes(buf).decode('utf-8'), token_name, dataset_dir).encode('utf-8'),
+        }
 
-            updated_data = {}
-            for key, value in data.items():
-                if existing_token:
-                    new_key = key.replace(existing_token, token_name) if existing_token != token_name else key
-                    updated_data[new_key] = (
-                        value.replace(existing_token, token_name) if existing_token != token_name else value
-                    )
-                else:
-                    new_key = key.replace('__TOKEN_NAME__', token_name).replace('_TOKEN_NAME_', token_name)
-                    updated_data[new_key] = value.replace('__TOKEN_NAME__', token_name).replace('_TOKEN_NAME_', token_name)
+        os.makedirs(target_dir, exist_ok=True)
+        with os.scandir(source_path) as it:
+            entries = list(it)
 
-            with open(filepath, 'w') as f:
-                json.dump(updated_data, f, indent=2)
-                
-        except Exception as e:
-            rprint(f"[red]Error processing user_prompt_library.json: {str(e)}[/red]")
+        with self.make_progress() as progress:
+            task = progress.add_task("Copying", total=len(entries))
+            for entry in entries:
+                self._copy_entry(entry, os.path.join(target_dir, entry.name), transforms)
+                progress.advance(task)
 
-    def process_multidatabackend(self, filepath: Path, token_name: str, dataset_name: str) -> None:
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+    def _copy_entry(self, entry: os.DirEntry, target: str, transforms: Dict[str, Any]) -> None:
+        if entry.is_dir():
+            copy_tree(entry.path, target)
+            return
 
-            cache_dir_name = f"{token_name}-{dataset_name}"
-            for item in data:
-                if isinstance(item, dict):
-                    if 'instance_data_dir' in item:
-                        item['instance_data_dir'] = f"datasets/{dataset_name}"
-                    if 'cache_dir_vae' in item:
-                        item['cache_dir_vae'] = f"cache/vae/{cache_dir_name}/{item.get('id', '')}"
-                    elif item.get('id') == 'text_embeds':
-                        item['cache_dir'] = f"cache/text/{cache_dir_name}"
-                        item.pop('instance_data_dir', None)
-                        item.pop('cache_dir_vae', None)
-
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-                
-        except Exception as e:
-            rprint(f"[red]Error processing multidatabackend.json: {str(e)}[/red]")
+        transform = transforms.get(entry.name)
+        if transform:
+            try:
+                with read_buffer(entry.path) as buf:
+                    content = transform(buf)
+                with open(target, 'wb') as f:
+                    f.write(content)
+                return
+            except Exception as e:
+                rprint(f"[red]Error processing {entry.name}: {str(e)}[/red]")
 
-    def update_config_files(self, token_name: str, new_version: str, source_dir: str, 
-                            dataset_dir: str, target_dir: str, old_version: Optional[str] = None) -> None:
-        try:
-            target_path = Path(target_dir)
-            
-            config_path = target_path / "config.json"
-            if config_path.exists():
-                self.process_config_json(config_path, token_name, new_version, old_version)
-
-            prompt_path = target_path / "user_prompt_library.json"
-            if prompt_path.exists():
-                self.process_user_prompt_library(
-                    prompt_path, 
-                    token_name,
-                    existing_token=token_name if old_version else None
-                )
-
-            backend_path = target_path / "multidatabackend.json"
-            if backend_path.exists():
-                self.process_multidatabackend(backend_path, token_name, dataset_dir)
-                
-        except Exception as e:
-            rprint(f"[red]Error updating configuration files: {str(e)}[/red]")
+        copy_file(entry.path, target, entry.stat().st_size)
+        shutil.copystat(entry.path, target)
 
     def run(self) -> Optional[Path]:
         self.clear_screen()
@@ -349,13 +457,7 @@ def run(self) -> Optional[Path]:
             if proceed == 'y':
                 backend_file = source_path / "multidatabackend.json"
                 try:
-                    with open(backend_file) as f:
-                        data = json.load(f)
-                        dataset_dir = next(
-                            (obj['instance_data_dir'].split('/')[-1]
-                             for obj in data if isinstance(obj, dict) and 'instance_data_dir' in obj),
-                            None
-                        )
+                    dataset_dir = self.read_dataset_dir(backend_file)
                     if dataset_dir:
                         rprint(f"[green]Using existing dataset: {dataset_dir}[/green]")
                     else:
@@ -435,6 +537,9 @@ def run(self) -> Optional[Path]:
             return None
 
         target_dir = self.root_path / f"{token_name}-{new_version}"
+        if target_dir.exists() and os.path.samefile(source_path, target_dir):
+            rprint("[red]Target directory is the source directory. Choose a different version.[/red]")
+            return None
 
         rprint("\n[cyan]Processing with following parameters:[/cyan]")
         rprint(f"[yellow]Source Directory: {source_path}[/yellow]")
@@ -449,19 +554,15 @@ def run(self) -> Optional[Path]:
             return None
 
         try:
-            rprint("\n[cyan]Copying files...[/cyan]")
-            self.show_rainbow_progress("Copying")
+            rprint("\n[cyan]Copying and updating files...[/cyan]")
             target_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(source_path, target_dir, dirs_exist_ok=True)
-
-            rprint("\n[cyan]Updating configuration files...[/cyan]")
-            self.show_rainbow_progress("Updating")
-            self.update_config_files(
-                token_name, 
-                new_version, 
-                str(source_path), 
-                dataset_dir, 
-                str(target_dir), 
+            self._folders_cache = None
+            self.copy_and_transform(
+                source_path,
+                target_dir,
+                token_name,
+                new_version,
+                dataset_dir,
                 old_version
             )
 
@@ -557,23 +658,20 @@ def display_templates(self, template_files: List[Tuple[Path, Dict[str, int]]]) -
             self.console.print(Columns(current_row, equal=True, expand=True))
 
     def process_user_prompt_library(self, filepath: Path, token_name: str, existing_token: Optional[str] = None) -> None:
+        if existing_token and existing_token == token_name:
+            return
+
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            content = filepath.read_text(encoding='utf-8')
 
-            updated_data = {}
-            for key, value in data.items():
-                if existing_token:
-                    new_key = key.replace(existing_token, token_name) if existing_token != token_name else key
-                    updated_data[new_key] = (
-                        value.replace(existing_token, token_name) if existing_token != token_name else value
-                    )
-                else:
-                    new_key = key.replace('__TOKEN_NAME__', token_name).replace('_TOKEN_NAME_', token_name)
-                    updated_data[new_key] = value.replace('__TOKEN_NAME__', token_name).replace('_TOKEN_NAME_', token_name)
+            # Substitute on the raw JSON text; the replacement is JSON-escaped,
+            # so the document stays valid without a parse/serialize round-trip
+            pattern = _literal_pattern(_json_escape(existing_token)) if existing_token else TOKEN_PLACEHOLDER_PATTERN
+            replacement = _json_escape(token_name)
+            content, count = pattern.subn(lambda m: replacement, content)
 
-            with open(filepath, 'w') as f:
-                json.dump(updated_data, f, indent=2)
+            if count:
+                filepath.write_text(content, encoding='utf-8')
                 
         except Exception as e:
             rprint(f"[red]Error processing user_prompt_library.json: {str(e)}[/red]")
@@ -593,10 +691,8 @@ def save_prompts_to_config(self, template_file: Path) -> None:
             with open(output_file, 'w', encoding='utf-8') as f:
                 json.dump(prompts, f, indent=2)
             
-            if os.path.isdir(config_dir):
-                token_name = os.path.basename(config_dir).split('-')[0]
-                self.process_user_prompt_library(output_file, token_name, None)
-
+            token_name = _base_name(config_dir.name)
+            self.process_user_prompt_library(output_file, token_name, None)
 
             self.console.print(f"[green]Successfully saved prompts to {output_file}[/green]")
 
@@ -638,23 +734,41 @@ def run(self) -> None:
 
 @contextmanager
 def raw_mode(file):
-    if os.name == 'nt':
+    if IS_WINDOWS:
         yield
-    else:
-        old_attrs = termios.tcgetattr(file.fileno())
-        new_attrs = old_attrs[:]
-        new_attrs[3] = new_attrs[3] & ~(termios.ECHO | termios.ICANON)
-        try:
-            termios.tcsetattr(file.fileno(), termios.TCSADRAIN, new_attrs)
-            yield
-        finally:
-            termios.tcsetattr(file.fileno(), termios.TCSADRAIN, old_attrs)
+        return
+
+    old_attrs = termios.tcgetattr(file.fileno())
+    new_attrs = old_attrs[:]
+    new_attrs[3] = new_attrs[3] & ~(termios.ECHO | termios.ICANON)
+    try:
+        termios.tcsetattr(file.fileno(), termios.TCSADRAIN, new_attrs)
+        yield
+    finally:
+        termios.tcsetattr(file.fileno(), termios.TCSADRAIN, old_attrs)
+
+_SEEN_BOOL, _SEEN_FLOAT, _SEEN_INT, _SEEN_OTHER = 1, 2, 4, 8
+
+# Seconds of input silence before a deferred redraw is painted
+INPUT_IDLE_TIMEOUT = 0.008
+
+def _format_float(value: float) -> str:
+    if abs(value) < 0.01 or abs(value) >= 1000:
+        return f"{value:.2e}"
+    return str(value)
+
+# Display formatting for config values, keyed by exact type (anything else uses str)
+_VALUE_FORMATTERS = {
+    bool: lambda value: 'true' if value else 'false',
+    float: _format_float,
+}
 
 class ParameterLibrary:
     def __init__(self):
         self.base_path = Path(__file__).parent.parent if '__file__' in globals() else Path('.')
         self.library_path = self.base_path / 'config' / 'set_config_lib.json'
         self.parameters: Dict[str, Dict] = {}
+        self._index: Dict[str, Any] = {}
         self.load_parameter_library()
     
     def load_parameter_library(self) -> None:
@@ -668,15 +782,18 @@ def load_parameter_library(self) -> None:
                 self.parameters = raw_data
         except Exception as e:
             raise RuntimeError(f"Failed to load parameter library: {str(e)}")
+
+        # Flatten categories into a single lookup keyed by bare parameter name
+        self._index = {}
+        for params in self.parameters.values():
+            for key, definition in params.items():
+                self._index.setdefault(key.lstrip('-'), definition)
     
     def get_parameter_definition(self, param_key: str) -> Dict:
-        key = param_key.lstrip('-')
-        for category, params in self.parameters.items():
-            if key in params:
-                return params[key]
-            if f"--{key}" in params:
-                return params[f"--{key}"]
-        raise KeyError(f"Parameter not found in library: {param_key}")
+        try:
+            return self._index[param_key.lstrip('-')]
+        except KeyError:
+            raise KeyError(f"Parameter not found in library: {param_key}")
 
 class ParameterSelector:
     def __init__(self):
@@ -701,9 +818,29 @@ def __init__(self, target_config_dir: Path):
         self.selector = ParameterSelector()
         self.parameters: Dict[str, Dict] = {}
         self.current_config: Optional[str] = None
+        self._config_root: Optional[Path] = None
         self.current_parameter: Optional[str] = None
         self.status_message: str = ""
         self.target_config_dir = target_config_dir
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(name='params', size=12),
+            Layout(name='options'),
+            Layout(name='input', size=1),
+            Layout(name='status', size=1)
+        )
+        self._live = Live(self._layout, console=self.console, auto_refresh=False)
+        self._params_panel_cache: Optional[Panel] = None
+        self._params_dirty = True
+        self._opts_cache_key: Optional[Tuple[Optional[str], Optional[str]]] = None
+        self._opts_cache: Optional[Panel] = None
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_cache_path: Optional[Path] = None
+        self._key_to_param: Dict[str, Dict] = {}
+        self._pending_input = ""
+        self._input_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._redraw_pending = False
+        self._batch_depth = 0
         self.initialize_parameters()
     
     def initialize_parameters(self) -> None:
@@ -718,26 +855,53 @@ def initialize_parameters(self) -> None:
                     "is_choice": is_choice or param_type == 'bool',
                     "type": param_type,
                     "options": self.get_parameter_options(param_def, param_type),
-                    "config_key": f"--{param_key}" if not param_key.startswith('--') else param_key
+                    "config_key": f"--{param_key}" if not param_key.startswith('--') else param_key,
+                    "_label": f"[yellow]{idx}[/yellow] [cyan]{param_key}[/cyan]"
                 }
             except KeyError as e:
                 self.console.print(f"[yellow]Warning: {str(e)}[/yellow]")
+
+        # Map both the dashed and bare spelling of each config key to its parameter
+        self._key_to_param = {}
+        for param in self.parameters.values():
+            self._key_to_param[param['config_key']] = param
+            self._key_to_param.setdefault(param['config_key'].lstrip('-'), param)
     
     def determine_parameter_type(self, param_def: Dict) -> Tuple[bool, str]:
-        if isinstance(param_def, dict):
-            if any(isinstance(x, bool) for x in param_def.values()):
-                return True, 'bool'
-            elif any(isinstance(x, float) for x in param_def.values()):
-                return False, 'float'
-            elif any(isinstance(x, int) for x in param_def.values()):
-                return False, 'int'
+        is_list = isinstance(param_def, list)
+        if is_list:
+            values = param_def
+        elif isinstance(param_def, dict):
+            values = param_def.values()
+        else:
             return False, 'string'
-        elif isinstance(param_def, list):
-            if all(isinstance(x, bool) for x in param_def):
+
+        # Single pass recording which JSON scalar types occur
+        seen = 0
+        for x in values:
+            t = type(x)
+            if t is bool:
+                seen |= _SEEN_BOOL
+            elif t is float:
+                seen |= _SEEN_FLOAT
+            elif t is int:
+                seen |= _SEEN_INT
+            else:
+                seen |= _SEEN_OTHER
+
+        if is_list:
+            if not seen & ~_SEEN_BOOL:
                 return True, 'bool'
-            elif all(isinstance(x, (int, float)) for x in param_def):
-                return False, 'float' if any(isinstance(x, float) for x in param_def) else 'int'
+            elif not seen & _SEEN_OTHER:
+                return False, 'float' if seen & _SEEN_FLOAT else 'int'
             return True, 'choice'
+
+        if seen & _SEEN_BOOL:
+            return True, 'bool'
+        elif seen & _SEEN_FLOAT:
+            return False, 'float'
+        elif seen & _SEEN_INT:
+            return False, 'int'
         return False, 'string'
     
     def get_parameter_options(self, param_def: Union[Dict, List], param_type: str) -> List:
@@ -748,61 +912,57 @@ def get_parameter_options(self, param_def: Union[Dict, List], param_type: str) -
         return []
     
     def parse_number_format(self, value: str) -> str:
-        try:
-            value = value.strip().lower()
+        value = value.strip().lower()
+
+        # Split notation (e.g. "1.5 4" -> "1.5e-4"); single tokens skip the split entirely
+        if ' ' in value or '\t' in value:
             parts = value.split()
             if len(parts) == 2:
                 try:
-                    base = float(parts[0])
-                    exp = int(parts[1])
-                    return f"{base}e-{exp}"
+                    return f"{float(parts[0])}e-{int(parts[1])}"
                 except ValueError:
                     raise ValueError("Invalid scientific notation format")
-            
-            try:
-                float(value)
-                return value
-            except ValueError:
-                raise ValueError("Invalid number format")
-                
-        except ValueError as e:
-            raise ValueError(str(e))
+
+        try:
+            float(value)
+        except ValueError:
+            raise ValueError("Invalid number format")
+        return value
+
+    def _set_param_value(self, param: Dict, value: str) -> None:
+        """Store a parameter value and invalidate the cached parameters panel."""
+        if param['value'] != value:
+            param['value'] = value
+            self._params_dirty = True
 
     def make_parameters_panel(self) -> Panel:
+        if not self._params_dirty and self._params_panel_cache is not None:
+            return self._params_panel_cache
+
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Parameter", style="cyan", width=30)
         table.add_column("Value", style="white", width=20)
         table.add_column("Parameter", style="cyan", width=30)
         table.add_column("Value", style="white", width=20)
         
-        params = list(self.parameters.items())
+        params = list(self.parameters.values())
         mid_point = (len(params) + 1) // 2  # Split parameters into two groups
 
-        # Iterate over the full range of parameters, splitting into left and right columns
-        for i in range(len(params)):
-            left = params[i] if i < mid_point else None
-            right = params[i + mid_point] if i + mid_point < len(params) else None
-            
-            if left and right:
-                table.add_row(
-                    f"[yellow]{left[0]}[/yellow] [cyan]{left[1]['name']}[/cyan]", 
-                    str(left[1]['value']) if left[1]['value'] else "",
-                    f"[yellow]{right[0]}[/yellow] [cyan]{right[1]['name']}[/cyan]", 
-                    str(right[1]['value']) if right[1]['value'] else ""
-                )
-            elif left:
-                table.add_row(
-                    f"[yellow]{left[0]}[/yellow] [cyan]{left[1]['name']}[/cyan]", 
-                    str(left[1]['value']) if left[1]['value'] else "",
-                    "", ""
-                )
+        # Pair each left-column parameter with its right-column neighbour (if any)
+        for left, right in zip_longest(params[:mid_point], params[mid_point:]):
+            if right:
+                table.add_row(left['_label'], left['value'] or "", right['_label'], right['value'] or "")
+            else:
+                table.add_row(left['_label'], left['value'] or "", "", "")
 
-        return Panel(
+        self._params_panel_cache = Panel(
             table,
             title=f"[gold1]Parameter Settings - {self.current_config}[/gold1]",
             border_style="blue",
             padding=(1, 1)
         )
+        self._params_dirty = False
+        return self._params_panel_cache
 
 
     def handle_save_and_rename(self, config_path: Path) -> None:
@@ -810,7 +970,7 @@ def handle_save_and_rename(self, config_path: Path) -> None:
         save_confirmed = False
         
         with raw_mode(sys.stdin):
-            key = sys.stdin.read(1)
+            key = self.read_key()
             if key == '\r' or key == '\n':
                 self.console.print("Yes")
                 self.save_changes(config_path)
@@ -822,7 +982,7 @@ def handle_save_and_rename(self, config_path: Path) -> None:
         if save_confirmed:
             self.console.print("\nRename config? (Space=Yes, Enter=No): ", end="")
             with raw_mode(sys.stdin):
-                key = sys.stdin.read(1)
+                key = self.read_key()
                 if key == ' ':
                     self.console.print("Yes")
                     self.handle_rename(config_path)
@@ -830,6 +990,13 @@ def handle_save_and_rename(self, config_path: Path) -> None:
                     self.console.print("No")
 
     def make_options_panel(self) -> Panel:
+        cache_key = (
+            self.current_parameter,
+            None if self.current_parameter is None else self.parameters[self.current_parameter]['value']
+        )
+        if cache_key == self._opts_cache_key:
+            return self._opts_cache
+
         content = ""
         
         if not self.current_parameter:
@@ -854,25 +1021,95 @@ def make_options_panel(self) -> Panel:
                 if param['type'] in type_hints:
                     content += f"\n{type_hints[param['type']]}"
         
-        return Panel(
+        self._opts_cache = Panel(
             content,
             title="[gold1]Parameter Options[/gold1]",
             border_style="blue",
             padding=(1, 1)
         )
+        self._opts_cache_key = cache_key
+        return self._opts_cache
+
+    @contextmanager
+    def batch_updates(self):
+        """Defer update_display calls until the outermost batch exits, then paint once."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._redraw_pending:
+                self.update_display()
 
     def update_display(self) -> None:
-        os.system('cls' if os.name == 'nt' else 'clear')
-        from rich.layout import Layout
-        layout = Layout()
-        layout.split_column(
-            Layout(self.make_parameters_panel(), size=12),
-            Layout(self.make_options_panel())
-        )
-        self.console.print(layout)
-        if self.status_message:
-            self.console.print(f"[red]{self.status_message}[/red]")
-            self.status_message = ""
+        if self._batch_depth:
+            self._redraw_pending = True
+            return
+
+        # Regions are updated in place; Live only repaints what changed
+        self._redraw_pending = False
+        self._layout['params'].update(self.make_parameters_panel())
+        self._layout['options'].update(self.make_options_panel())
+        self._layout['status'].update(Text(self.status_message, style="red"))
+        self.status_message = ""
+        self._live.refresh()
+
+    def request_display(self) -> None:
+        """Schedule a redraw for the next time input goes idle."""
+        self._redraw_pending = True
+
+    def read_key(self) -> str:
+        """Return the next key, draining all queued input bytes in one read.
+
+        Pending redraws are deferred while input keeps arriving, so bursts
+        (pastes, key repeat) are rendered once. Escape sequences such as
+        arrow keys are returned whole.
+        """
+        if IS_WINDOWS:
+            if self._redraw_pending:
+                self.update_display()
+            return sys.stdin.read(1)
+
+        fd = sys.stdin.fileno()
+        while not self._pending_input:
+            if self._redraw_pending:
+                ready, _, _ = select.select([fd], [], [], INPUT_IDLE_TIMEOUT)
+                if not ready:
+                    self.update_display()
+                    continue
+            data = os.read(fd, 64)
+            if not data:
+                return ''
+            self._pending_input += self._input_decoder.decode(data)
+
+        pending = self._pending_input
+        end = 1
+        if pending[0] == '\x1b' and len(pending) > 1 and pending[1] in '[O':
+            end = 2
+            while end < len(pending) and not '@' <= pending[end] <= '~':
+                end += 1
+            end = min(end + 1, len(pending))
+        key, self._pending_input = pending[:end], pending[end:]
+        return key
+
+    def read_value(self, prompt: str) -> str:
+        """Read a line of raw-mode input, echoing it in the input region."""
+        buffer = ""
+        while True:
+            self._layout['input'].update(Text(f"{prompt}{buffer}"))
+            self.request_display()
+            ch = self.read_key()
+            if ch in ('\r', '\n'):
+                break
+            if ch in ('\x1b', ''):  # Escape or end of input - abandon the edit
+                buffer = ""
+                break
+            if ch in ('\x7f', '\b'):
+                buffer = buffer[:-1]
+            elif ch.isprintable():
+                buffer += ch
+        self._layout['input'].update(Text(""))
+        return buffer.strip()
 
     def handle_parameter_input(self, value: str, immediate: bool = False) -> bool:
         if not value:
@@ -886,9 +1123,8 @@ def handle_parameter_input(self, value: str, immediate: bool = False) -> bool:
                     try:
                         idx = int(value) - 1
                         if 0 <= idx < len(param['options']):
-                            param['value'] = str(param['options'][idx])
+                            self._set_param_value(param, str(param['options'][idx]))
                             self.current_parameter = None
-                            self.console.print(f"\nSelected: {param['value']}")
                             return True
                     except ValueError:
                         pass
@@ -896,20 +1132,17 @@ def handle_parameter_input(self, value: str, immediate: bool = False) -> bool:
                 
                 idx = int(value) - 1
                 if 0 <= idx < len(param['options']):
-                    param['value'] = str(param['options'][idx])
+                    self._set_param_value(param, str(param['options'][idx]))
                     return True
                 else:
                     raise ValueError("Invalid option selection")
             elif param['type'] == 'float':
                 parsed_value = self.parse_number_format(value)
-                param['value'] = parsed_value
-                self.console.print(f"\nEntered: {param['value']}")
+                self._set_param_value(param, parsed_value)
             elif param['type'] == 'int':
-                param['value'] = str(int(value))
-                self.console.print(f"\nEntered: {param['value']}")
+                self._set_param_value(param, str(int(value)))
             else:
-                param['value'] = str(value)
-                self.console.print(f"\nEntered: {param['value']}")
+                self._set_param_value(param, str(value))
             
             return True
             
@@ -919,62 +1152,56 @@ def handle_parameter_input(self, value: str, immediate: bool = False) -> bool:
 
     def edit_config(self, config_path: Path) -> None:
         self.current_config = config_path.parent.name
+        self._config_root = config_path.parent.parent
+        self._params_dirty = True
         
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                for param in self.parameters.values():
-                    config_key = param['config_key']
-                    key_without_dashes = config_key.lstrip('-')
-                    
-                    value = None
-                    if config_key in config:
-                        value = config[config_key]
-                    elif key_without_dashes in config:
-                        value = config[key_without_dashes]
-                    
-                    if value is not None:
-                        if isinstance(value, bool):
-                            param['value'] = str(value).lower()
-                        elif isinstance(value, float):
-                            if abs(value) < 0.01 or abs(value) >= 1000:
-                                param['value'] = f"{value:.2e}"
-                            else:
-                                param['value'] = str(value)
-                        else:
-                            param['value'] = str(value)
-                    
-        except Exception as e:
-            self.console.print(f"[red]Error loading config: {str(e)}[/red]")
-            return
+        with self.batch_updates():
+            try:
+                config = read_json(config_path)
+                # Keep the parsed config so save_changes can skip a re-read
+                self._config_cache = config
+                self._config_cache_path = config_path
+                for key, value in config.items():
+                    param = self._key_to_param.get(key)
+                    if param is None or value is None:
+                        continue
+                    # The dashed spelling wins when a config carries both
+                    if key != param['config_key'] and param['config_key'] in config:
+                        continue
+
+                    formatter = _VALUE_FORMATTERS.get(type(value), str)
+                    self._set_param_value(param, formatter(value))
+                        
+            except Exception as e:
+                self.console.print(f"[red]Error loading config: {str(e)}[/red]")
+                return
 
-        self.update_display()
+            self.update_display()
 
-        with raw_mode(sys.stdin):
+        with raw_mode(sys.stdin), self._live:
             while True:
                 if not self.current_parameter:
-                    key = sys.stdin.read(1)
-                    if key in ('\r', '\n'):
+                    key = self.read_key()
+                    if key in ('\r', '\n', ''):
                         break
                     elif key in self.parameters:
                         self.current_parameter = key
-                        self.console.print(f"\nSelected parameter: {self.parameters[key]['name']}")
-                        self.update_display()
+                        self.request_display()
                         
                         if self.parameters[key]['is_choice']:
                             while True:
-                                choice = sys.stdin.read(1)
-                                if choice in ('\r', '\n'):
+                                choice = self.read_key()
+                                if choice in ('\r', '\n', ''):
                                     self.current_parameter = None
                                     break
                                 if self.handle_parameter_input(choice, immediate=True):
                                     break
-                            self.update_display()
+                            self.request_display()
                 else:
-                    value = self.console.input("\nEnter value: ").strip()
+                    value = self.read_value("Enter value: ")
                     if self.handle_parameter_input(value):
                         self.current_parameter = None
-                        self.update_display()
+                    self.request_display()
 
         self.handle_save_and_rename(config_path)
 
@@ -984,16 +1211,19 @@ def save_changes(self, config_path: Path) -> None:
             return
 
         try:
-            with open(config_path, 'r') as f:
+            if self._config_cache is not None and self._config_cache_path == config_path:
+                config = self._config_cache
+            else:
                 try:
-                    config = json.load(f)
+                    config = read_json(config_path)
                 except json.JSONDecodeError:
                     self.console.print(f"[red]Invalid JSON format in file: {config_path}[/red]")
                     return
 
+            warnings: List[str] = []
             for param in self.parameters.values():
                 if 'config_key' not in param:
-                    self.console.print(f"[yellow]Skipping parameter with missing config_key: {param}[/yellow]")
+                    warnings.append(f"[yellow]Skipping parameter with missing config_key: {param}[/yellow]")
                     continue
                 try:
                     if param['type'] == 'float':
@@ -1005,11 +1235,13 @@ def save_changes(self, config_path: Path) -> None:
                     else:
                         config[param['config_key']] = param['value']
                 except ValueError:
-                    self.console.print(f"[red]Invalid value for {param['config_key']}: {param['value']}[/red]")
+                    warnings.append(f"[red]Invalid value for {param['config_key']}: {param['value']}[/red]")
+
+            if warnings:
+                self.console.print("\n".join(warnings))
 
             try:
-                with open(config_path, 'w') as f:
-                    json.dump(config, f, indent=4)
+                write_json(config_path, config)
                 self.console.print("[green]Config saved successfully![/green]")
             except OSError as e:
                 self.console.print(f"[red]Failed to save config: {str(e)}[/red]")
@@ -1051,8 +1283,7 @@ def edit_config_family(self, new_folder_name: str, config_path: Path):
             raise ValueError("Invalid folder name format. Expected format: 'name-version'")
 
         try:
-            with open(config_path, 'r') as file:
-                config = json.load(file)
+            config = read_json(config_path)
         except FileNotFoundError:
             print(f"Config file not found at: {config_path}")
             return
@@ -1066,17 +1297,16 @@ def edit_config_family(self, new_folder_name: str, config_path: Path):
         config["--output_dir"] = f"output/{name}/{version}"
 
         try:
-            with open(config_path, 'w') as file:
-                json.dump(config, file, indent=4)
+            write_json(config_path, config)
             print(f"Config updated successfully: {config_path}")
         except Exception as e:
             print(f"Failed to save updated config: {e}")
 
     def validate_new_name(self, new_name: str) -> bool:
-        if not all(c.isalnum() or c in '-_' for c in new_name):
+        if not VALID_NAME_PATTERN.fullmatch(new_name):
             return False
         
-        new_path = Path(self.current_config).parent.parent / new_name
+        new_path = (self._config_root or Path(self.current_config).parent.parent) / new_name
         if new_path.exists():
             return False
             
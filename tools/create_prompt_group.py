@@ -1,12 +1,39 @@
 import os
-import json
+import sys
+import codecs
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Tuple
-from rich.console import Console
-from rich.panel import Panel
+from typing import Dict, List, Set, Tuple
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
 from datetime import datetime
 from collections import defaultdict
 
+from .json_io import read_json, write_json
+
+PAGE_SIZE = 20
+PANEL_WIDTH = 120
+SELECT_PROMPT = "Enter number to select prompt (or press Enter to finish): "
+
+@contextmanager
+def cbreak_mode(file):
+    """Turn off line buffering and echo so typed input can be drawn by Live."""
+    # Piped input keeps its line discipline; read_line falls back to input()
+    if os.name == 'nt' or not file.isatty():
+        yield
+        return
+
+    import termios
+    import tty
+    old_attrs = termios.tcgetattr(file.fileno())
+    try:
+        tty.setcbreak(file.fileno())
+        yield
+    finally:
+        termios.tcsetattr(file.fileno(), termios.TCSADRAIN, old_attrs)
+
 class Tool:
     def __init__(self):
         self.console = Console()
@@ -15,10 +42,11 @@ def __init__(self):
         self.templates_path = self.simpletuner_path / 'prompts' / 'templates'
         self.all_prompts: List[Tuple[str, str, Path, datetime]] = []  # (name, prompt, source_file, modified_date)
         self.selected_prompts: Dict[str, str] = {}
+        self.selected_indices: Set[int] = set()
 
-    def get_file_modified_time(self, file_path: Path) -> datetime:
-        """Get last modified time of file as datetime object"""
-        return datetime.fromtimestamp(file_path.stat().st_mtime)
+    def get_file_modified_time(self, entry: os.DirEntry) -> datetime:
+        """Get last modified time of a scanned file as datetime object"""
+        return datetime.fromtimestamp(entry.stat().st_mtime)
 
     def load_all_prompts(self) -> None:
         """Load all prompts from all JSON files in templates directory"""
@@ -26,55 +54,91 @@ def load_all_prompts(self) -> None:
             self.console.print(f"[red]Templates directory not found: {self.templates_path}[/red]")
             return
 
-        for file_path in self.templates_path.glob('*.json'):
+        with os.scandir(self.templates_path) as entries:
+            json_files = [entry for entry in entries
+                          if entry.name.endswith('.json') and entry.is_file()]
+
+        for entry in json_files:
+            file_path = Path(entry.path)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    prompts = json.load(f)
-                    modified_time = self.get_file_modified_time(file_path)
-                    # Store each prompt with its source file and modification time
-                    for name, prompt in prompts.items():
-                        self.all_prompts.append((name, prompt, file_path, modified_time))
-                        
-                # Sort by modification time, newest first
-                self.all_prompts.sort(key=lambda x: x[3], reverse=True)
+                prompts = read_json(entry.path)
+                modified_time = self.get_file_modified_time(entry)
+                # Store each prompt with its source file and modification time
+                for name, prompt in prompts.items():
+                    self.all_prompts.append((name, prompt, file_path, modified_time))
                         
             except Exception as e:
                 self.console.print(f"[red]Error loading {file_path.name}: {str(e)}[/red]")
 
-    def display_prompts(self) -> None:
-        """Display all available prompts in full-width panels, grouped by file and date"""
-        if not self.all_prompts:
-            self.console.print("[red]No prompts found[/red]")
-            return
-    
-        self.console.print("\n[cyan]Available Prompts:[/cyan]")
-        
-        current_date = None
-        current_file = None
-        panel_width = 120
-        
-        for idx, (name, prompt, source_file, modified_time) in enumerate(self.all_prompts, 1):
-            # Format date string
+        # Sort by modification time, newest first
+        self.all_prompts.sort(key=lambda x: x[3], reverse=True)
+
+    def page_count(self) -> int:
+        return max(1, -(-len(self.all_prompts) // PAGE_SIZE))
+
+    def build_page(self, page: int) -> Table:
+        """Build one page of prompts as a single table, grouped by file and date"""
+        table = Table(
+            title="[cyan]Available Prompts[/cyan]",
+            caption=f"Page {page + 1}/{self.page_count()}  [dim]n: next  p: previous[/dim]",
+            border_style="blue",
+            width=PANEL_WIDTH,
+        )
+        table.add_column("#", style="yellow", justify="right", no_wrap=True)
+        table.add_column("Name", style="#FF1493", no_wrap=True)
+        table.add_column("Prompt", no_wrap=True, overflow="ellipsis", ratio=1)
+        table.add_column("File", style="#FFE135", no_wrap=True)
+        table.add_column("Modified", style="#00B8B8", no_wrap=True)
+
+        start = page * PAGE_SIZE
+        previous_group = None
+        for idx, (name, prompt, source_file, modified_time) in enumerate(
+                self.all_prompts[start:start + PAGE_SIZE], start + 1):
             date_str = modified_time.strftime("%Y-%m-%d %H:%M")
-            
-            # If we're starting a new date/file group, print the header
-            if date_str != current_date or source_file != current_file:
-                # Get filename without extension
+            # Only label the first row of each file/date group
+            group = (source_file, date_str)
+            if group == previous_group:
+                file_base = date_str = ""
+            else:
                 file_base = source_file.stem
-                # Right align date with spacing calculation
-                spacing = panel_width - len(file_base) - len(date_str)
-                header = f"[#FFE135]{file_base}[/#FFE135]" + " " * spacing + f"[#00B8B8]{date_str}[/#00B8B8]"
-                self.console.print(f"\n{header}")
-                current_date = date_str
-                current_file = source_file
-            
-            panel = Panel(
-                prompt,  # Just display the prompt text
-                title=f"[yellow]{idx}.[/yellow] [#FF1493]{name}[/#FF1493]",  # Number in yellow, shortname in bright pink
-                border_style="blue",
-                width=panel_width
-            )
-            self.console.print(panel)
+                previous_group = group
+            table.add_row(f"{idx}.", name, Text(" ".join(prompt.split())), file_base, date_str)
+
+        return table
+
+    def build_view(self, table: Table, status: str, typed: str) -> Group:
+        """Combine the current page with the selection summary and input line"""
+        selected = ", ".join(self.selected_prompts) or "[dim]none[/dim]"
+        return Group(
+            table,
+            Text.from_markup(f"[cyan]Selected Prompts:[/cyan] {selected}"),
+            Text.from_markup(status),
+            Text(SELECT_PROMPT + typed),
+        )
+
+    def read_line(self, live: Live, table: Table, status: str) -> str:
+        """Read a line of input, echoing it inside the live view"""
+        if os.name == 'nt' or not sys.stdin.isatty():
+            live.update(self.build_view(table, status, ""), refresh=True)
+            return input().strip()
+
+        fd = sys.stdin.fileno()
+        decoder = codecs.getincrementaldecoder('utf-8')('ignore')
+        typed = ""
+        while True:
+            # Only the small input line changes per keystroke; the page table is reused
+            live.update(self.build_view(table, status, typed), refresh=True)
+            data = os.read(fd, 64)
+            if not data:
+                # Stdin closed; end the session the way input() would
+                raise EOFError
+            for ch in decoder.decode(data):
+                if ch in '\r\n':
+                    return typed.strip()
+                if ch in '\x7f\b':
+                    typed = typed[:-1]
+                elif ch.isprintable():
+                    typed += ch
 
     def save_prompt_group(self, filename: str) -> None:
         """Save selected prompts to a new template file"""
@@ -87,8 +151,7 @@ def save_prompt_group(self, filename: str) -> None:
             # Create templates directory if it doesn't exist
             self.templates_path.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.selected_prompts, f, indent=4)
+            write_json(output_path, self.selected_prompts)
             
             self.console.print(f"[green]Successfully saved prompt group to {output_path}[/green]")
         
@@ -102,35 +165,48 @@ def run(self) -> None:
         # Load all available prompts
         self.load_all_prompts()
         
-        # Main selection loop
-        while True:
-            self.display_prompts()
-            
-            # Show currently selected prompts
-            if self.selected_prompts:
-                self.console.print("\n[cyan]Selected Prompts:[/cyan]")
-                for name in self.selected_prompts:
-                    self.console.print(f"- {name}")
-            
-            choice = input("\nEnter number to select prompt (or press Enter to finish): ").strip()
-            
-            if not choice:
-                if not self.selected_prompts:
-                    self.console.print("[yellow]No prompts selected. Exiting...[/yellow]")
-                    return
-                break
-                
-            try:
-                idx = int(choice)
-                if 1 <= idx <= len(self.all_prompts):
-                    # Get the prompt at the selected index
-                    name, prompt, _, _ = self.all_prompts[idx - 1]
-                    self.selected_prompts[name] = prompt
-                    self.console.print(f"[green]Added prompt: {name}[/green]")
-                else:
-                    self.console.print("[red]Invalid selection. Please try again.[/red]")
-            except ValueError:
-                self.console.print("[red]Please enter a valid number.[/red]")
+        if not self.all_prompts:
+            self.console.print("[red]No prompts found[/red]")
+            return
+
+        # Main selection loop; the page is redrawn in place after each choice
+        page = 0
+        table = self.build_page(page)
+        status = ""
+        with cbreak_mode(sys.stdin), Live(table, console=self.console, auto_refresh=False) as live:
+            while True:
+                choice = self.read_line(live, table, status)
+                status = ""
+
+                if not choice:
+                    break
+                if choice.lower() in ('n', 'p'):
+                    step = 1 if choice.lower() == 'n' else -1
+                    page = min(max(page + step, 0), self.page_count() - 1)
+                    table = self.build_page(page)
+                    continue
+
+                try:
+                    idx = int(choice)
+                    if idx in self.selected_indices:
+                        status = f"[yellow]Prompt {idx} is already selected.[/yellow]"
+                    elif 1 <= idx <= len(self.all_prompts):
+                        # Get the prompt at the selected index
+                        name, prompt, _, _ = self.all_prompts[idx - 1]
+                        if name in self.selected_prompts:
+                            status = f"[yellow]Replaced prompt with the same name: {name}[/yellow]"
+                        else:
+                            status = f"[green]Added prompt: {name}[/green]"
+                        self.selected_prompts[name] = prompt
+                        self.selected_indices.add(idx)
+                    else:
+                        status = "[red]Invalid selection. Please try again.[/red]"
+                except ValueError:
+                    status = "[red]Please enter a valid number.[/red]"
+
+        if not self.selected_prompts:
+            self.console.print("[yellow]No prompts selected. Exiting...[/yellow]")
+            return
         
         # Get filename for the new template
         filename = input("\nEnter filename for the prompt group (without .json): ").strip()
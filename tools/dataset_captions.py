@@ -1,89 +1,37 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.columns import Columns
+from typing import List, Optional, Tuple
 from rich.prompt import Prompt
-import json
 import random
 
-class DatasetCaptionsTool:
+from .config_browser import ConfigBrowser
+
+CAPTION_SAMPLE_SIZE = 10
+
+class DatasetCaptionsTool(ConfigBrowser):
     def __init__(self):
-        self.console = Console()
-        self.config_path = Path('/workspace/SimpleTuner/config')
-        self.datasets_path = Path('/workspace/SimpleTuner/datasets')
+        super().__init__()
         self.console.print(f"[cyan]Initialized with config path: {self.config_path}[/cyan]")
         self.console.print(f"[cyan]Datasets path: {self.datasets_path}[/cyan]")
 
-    def list_config_folders(self) -> List[str]:
-        folders = [f for f in self.config_path.iterdir() 
-                  if f.is_dir() and f.name != 'templates' 
-                  and not f.name.startswith('.ipynb_checkpoints')]
-        
-        grouped = {}
-        ordered_folders = []
-        panels = []
-        index = 1
-        
-        for folder in folders:
-            base_name = folder.name.split('-', 1)[0]
-            grouped.setdefault(base_name, []).append(folder.name)
-            
-        for base_name in sorted(grouped.keys()):
-            content = []
-            names_in_group = sorted(grouped[base_name], key=str.lower, reverse=True)
-            
-            content.append(f"[yellow]{index}.[/yellow] all")
-            ordered_folders.append(f"{base_name}:all")
-            index += 1
-            
-            for name in names_in_group:
-                content.append(f"[yellow]{index}.[/yellow] {name}")
-                ordered_folders.append(name)
-                index += 1
-                
-            panel = Panel(
-                "\n".join(content),
-                title=f"[yellow]{base_name}[/yellow]",
-                border_style="blue",
-                width=40
-            )
-            panels.append(panel)
-        
-        for i in range(0, len(panels), 3):
-            row_panels = panels[i:i + 3]
-            self.console.print(Columns(row_panels, equal=True, expand=True))
-            
-        return ordered_folders
-
     def get_dataset_path(self, config_dir: Path) -> Optional[Path]:
         backend_file = config_dir / "multidatabackend.json"
-        self.console.print(f"[yellow]Looking for backend file: {backend_file}[/yellow]")
-        
         if not backend_file.exists():
             self.console.print(f"[red]Backend file not found: {backend_file}[/red]")
             return None
-            
+
+        full_path = super().get_dataset_path(config_dir)
+        if not full_path:
+            self.console.print("[red]No valid instance_data_dir found in backend file[/red]")
+        return full_path
+
+    @staticmethod
+    def read_caption(file: Path) -> Tuple[Path, Optional[str], Optional[Exception]]:
         try:
-            with open(backend_file) as f:
-                self.console.print("[green]Successfully opened backend file[/green]")
-                data = json.load(f)
-                self.console.print(f"[yellow]Backend data structure: {type(data)}[/yellow]")
-                
-                for item in data:
-                    self.console.print(f"[yellow]Processing item: {item}[/yellow]")
-                    if isinstance(item, dict) and 'instance_data_dir' in item:
-                        dataset_path = item['instance_data_dir'].split('/')[-1]
-                        full_path = self.datasets_path / dataset_path
-                        self.console.print(f"[green]Found dataset path: {full_path}[/green]")
-                        return full_path
-                
-                self.console.print("[red]No valid instance_data_dir found in backend file[/red]")
-                return None
+            return file, file.read_text(encoding='utf-8').strip(), None
         except Exception as e:
-            self.console.print(f"[red]Error reading backend file: {str(e)}[/red]")
-            return None
+            return file, None, e
 
     def process_captions(self, dataset_dir: Path, output_file: Path):
         self.console.print(f"[cyan]Processing captions from: {dataset_dir}[/cyan]")
@@ -92,29 +40,43 @@ def process_captions(self, dataset_dir: Path, output_file: Path):
             self.console.print(f"[red]Dataset directory does not exist: {dataset_dir}[/red]")
             return
             
-        caption_files = list(dataset_dir.glob("*.txt"))
-        self.console.print(f"[yellow]Found {len(caption_files)} caption files[/yellow]")
+        # One directory pass that reservoir-samples as it goes, so only
+        # CAPTION_SAMPLE_SIZE paths are held; like glob, skip hidden files
+        selected_files = []
+        caption_count = 0
+        with os.scandir(dataset_dir) as entries:
+            for entry in entries:
+                if (entry.name.startswith('.')
+                        or os.path.splitext(entry.name)[1].lower() != '.txt'
+                        or not entry.is_file()):
+                    continue
+                if caption_count < CAPTION_SAMPLE_SIZE:
+                    selected_files.append(Path(entry.path))
+                else:
+                    slot = random.randint(0, caption_count)
+                    if slot < CAPTION_SAMPLE_SIZE:
+                        selected_files[slot] = Path(entry.path)
+                caption_count += 1
+        self.console.print(f"[yellow]Found {caption_count} caption files[/yellow]")
         
-        if not caption_files:
+        if not selected_files:
             self.console.print("[red]No caption files found in dataset directory[/red]")
             return
 
-        selected_files = random.sample(caption_files, min(10, len(caption_files)))
         self.console.print(f"[green]Selected {len(selected_files)} random files[/green]")
         
+        # Read the sampled files concurrently; only problems are reported per file
+        with ThreadPoolExecutor(max_workers=len(selected_files)) as executor:
+            results = list(executor.map(self.read_caption, selected_files))
+
         captions = []
-        for file in selected_files:
-            try:
-                self.console.print(f"[yellow]Reading caption from: {file.name}[/yellow]")
-                with open(file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if content:
-                        captions.append(f"# Caption from {file.name}\n{content}\n")
-                        self.console.print(f"[green]Successfully read caption from {file.name}[/green]")
-                    else:
-                        self.console.print(f"[red]Empty caption file: {file.name}[/red]")
-            except Exception as e:
-                self.console.print(f"[red]Error reading {file}: {str(e)}[/red]")
+        for file, content, error in results:
+            if error is not None:
+                self.console.print(f"[red]Error reading {file}: {str(error)}[/red]")
+            elif content:
+                captions.append(f"# Caption from {file.name}\n{content}\n")
+            else:
+                self.console.print(f"[red]Empty caption file: {file.name}[/red]")
 
         if captions:
             try:
@@ -145,7 +107,7 @@ def process_single_config(self, config_dir):
 
     def run(self):
         while True:
-            config_folders = self.list_config_folders()
+            config_folders, grouped = self.list_config_folders()
             if not config_folders:
                 self.console.print("[red]No configuration folders found[/red]")
                 return
@@ -157,11 +119,8 @@ def run(self):
             try:
                 selected = config_folders[int(folder_num) - 1]
                 
-                if ":all" in selected:
-                    base_name = selected.split(":")[0]
-                    group_configs = [f for f in config_folders 
-                                   if f.startswith(base_name) and ":all" not in f]
-                    
+                if selected.endswith(":all"):
+                    group_configs = grouped[selected[:-len(":all")]]
                     for config in group_configs:
                         self.console.print(f"[cyan]Processing {config}...[/cyan]")
                         config_dir = self.config_path / config
@@ -1,89 +1,70 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.columns import Columns
+from typing import List, Optional, Tuple
 from rich.prompt import Prompt
-from PIL import Image
-import json
+from PIL import Image, ImageDraw, ImageFont
 import math
+import random
 
-class DatasetGridTool:
+from .config_browser import ConfigBrowser
+from .grid_jpeg import encode_within_limit
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+CELL_SIZE = (512, 512)
+# Larger datasets are randomly sampled down to this many tiles
+MAX_TILES = 100
+TITLE_FONT_SIZE = 40
+
+class DatasetGridTool(ConfigBrowser):
     def __init__(self):
-        self.console = Console()
-        self.config_path = Path('/workspace/SimpleTuner/config')
-        self.datasets_path = Path('/workspace/SimpleTuner/datasets')
-
-    def list_config_folders(self) -> List[str]:
-        """List configuration folders grouped by base name."""
-        folders = [f for f in self.config_path.iterdir() 
-                  if f.is_dir() and f.name != 'templates' 
-                  and not f.name.startswith('.ipynb_checkpoints')]
-        
-        grouped = {}
-        ordered_folders = []
-        panels = []
-        index = 1
-        
-        for folder in folders:
-            base_name = folder.name.split('-', 1)[0]
-            grouped.setdefault(base_name, []).append(folder.name)
-            
-        for base_name in sorted(grouped.keys()):
-            content = []
-            names_in_group = sorted(grouped[base_name], key=str.lower, reverse=True)
-            
-            # Add "process all" option for each group
-            content.append(f"[yellow]{index}.[/yellow] all")
-            ordered_folders.append(f"{base_name}:all")
-            index += 1
-            
-            # Add individual folders
-            for name in names_in_group:
-                content.append(f"[yellow]{index}.[/yellow] {name}")
-                ordered_folders.append(name)
-                index += 1
-                
-            panel = Panel(
-                "\n".join(content),
-                title=f"[yellow]{base_name}[/yellow]",
-                border_style="blue",
-                width=40
-            )
-            panels.append(panel)
-        
-        for i in range(0, len(panels), 3):
-            row_panels = panels[i:i + 3]
-            self.console.print(Columns(row_panels, equal=True, expand=True))
-            
-        return ordered_folders
+        super().__init__()
+        self._font = None
 
-    def get_dataset_path(self, config_dir: Path) -> Optional[Path]:
-        """Extract dataset path from multidatabackend.json."""
-        backend_file = config_dir / "multidatabackend.json"
+    def _get_font(self):
+        """Load the title font once and reuse it for every grid."""
+        if self._font is None:
+            try:
+                self._font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", TITLE_FONT_SIZE)
+            except Exception:
+                self._font = ImageFont.load_default()
+        return self._font
+
+    @staticmethod
+    def load_thumbnail(img_path: Path) -> Tuple[Optional[Image.Image], Optional[Exception]]:
+        """Decode one image and shrink it to a grid cell."""
         try:
-            with open(backend_file) as f:
-                data = json.load(f)
-                for item in data:
-                    if isinstance(item, dict) and 'instance_data_dir' in item:
-                        dataset_path = item['instance_data_dir'].split('/')[-1]
-                        return self.datasets_path / dataset_path
+            img = Image.open(img_path)
+            # Let libjpeg scale down in the DCT domain; a no-op for other formats
+            img.draft('RGB', (CELL_SIZE[0] * 2, CELL_SIZE[1] * 2))
+            # Palette/bilevel images only resample with NEAREST, and alpha is resampled
+            # premultiplied (transparent pixels turn black), so those convert first;
+            # everything else is shrunk before the (now small) convert
+            if img.mode in ('P', '1') or 'A' in img.getbands():
+                img = img.convert('RGB')
+            img.thumbnail(CELL_SIZE, Image.Resampling.LANCZOS, reducing_gap=2.0)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            return img, None
         except Exception as e:
-            self.console.print(f"[red]Error reading dataset path: {str(e)}[/red]")
-        return None
+            return None, e
 
     def create_grid(self, images: List[Path], output_path: Path, title: str):
-        """Create and save image grid."""
+        """Create and save image grid.
+
+        ``images`` comes from a case-insensitive extension scan, so .JPG,
+        .JPEG and .PNG files are part of the grid too.
+        """
+        # PIL releases the GIL while decoding and resampling, so threads overlap the work
+        with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as executor:
+            results = list(executor.map(self.load_thumbnail, images))
+
         pil_images = []
-        for img_path in images:
-            try:
-                img = Image.open(img_path)
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
+        for img_path, (img, error) in zip(images, results):
+            if error is not None:
+                self.console.print(f"[red]Error loading {img_path}: {str(error)}[/red]")
+            else:
                 pil_images.append(img)
-            except Exception as e:
-                self.console.print(f"[red]Error loading {img_path}: {str(e)}[/red]")
 
         if not pil_images:
             return
@@ -92,8 +73,7 @@ def create_grid(self, images: List[Path], output_path: Path, title: str):
         cols = math.ceil(math.sqrt(n))
         rows = math.ceil(n / cols)
 
-        cell_width = 512
-        cell_height = 512
+        cell_width, cell_height = CELL_SIZE
         title_height = 60
 
         grid = Image.new('RGB', 
@@ -103,30 +83,19 @@ def create_grid(self, images: List[Path], output_path: Path, title: str):
         for idx, img in enumerate(pil_images):
             row = idx // cols
             col = idx % cols
-            img.thumbnail((cell_width, cell_height), Image.Resampling.LANCZOS)
             
             x = col * cell_width
             y = row * cell_height + title_height
             grid.paste(img, (x, y))
 
-        from PIL import ImageDraw, ImageFont
+        # Center from one text measurement instead of Pillow's anchor handling
+        font = self._get_font()
         draw = ImageDraw.Draw(grid)
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 40)
-        except:
-            font = ImageFont.load_default()
-        
-        draw.text((grid.width//2, title_height//2), title, 
-                  fill='black', font=font, anchor="mm")
-
-        quality = 95
-        while True:
-            test_path = output_path.with_suffix('.tmp.jpg')
-            grid.save(test_path, 'JPEG', quality=quality)
-            if test_path.stat().st_size <= 15_000_000 or quality <= 30:
-                test_path.rename(output_path)
-                break
-            quality -= 5
+        x = (grid.width - int(font.getlength(title))) // 2
+        y = (title_height - TITLE_FONT_SIZE) // 2
+        draw.text((x, y), title, fill='black', font=font)
+
+        output_path.write_bytes(encode_within_limit(grid))
 
     def process_single_config(self, config_dir):
         dataset_dir = self.get_dataset_path(config_dir)
@@ -138,9 +107,12 @@ def process_single_config(self, config_dir):
             self.console.print(f"[red]Dataset directory not found: {dataset_dir}[/red]")
             return
 
-        images = list(dataset_dir.glob("*.jpg")) + \
-                list(dataset_dir.glob("*.jpeg")) + \
-                list(dataset_dir.glob("*.png"))
+        # One directory pass; like glob, skip hidden files
+        with os.scandir(dataset_dir) as entries:
+            images = [Path(entry.path) for entry in entries
+                      if not entry.name.startswith('.')
+                      and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                      and entry.is_file()]
 
         if not images:
             self.console.print("[red]No images found in dataset directory[/red]")
@@ -148,13 +120,18 @@ def process_single_config(self, config_dir):
 
         output_file = config_dir / f"{config_dir.name}-dataset-grid.jpg"
         title = f"{config_dir.name} - {dataset_dir.name}"
+
+        total = len(images)
+        if total > MAX_TILES:
+            images = random.sample(images, MAX_TILES)
+            title = f"{title} (sample of {MAX_TILES}/{total})"
         
         self.console.print("[cyan]Creating dataset grid...[/cyan]")
         self.create_grid(images, output_file, title)
         self.console.print(f"[cyan]Grid saved to: {output_file}[/cyan]")
 
     def run(self):
-        config_folders = self.list_config_folders()
+        config_folders, grouped = self.list_config_folders()
         if not config_folders:
             self.console.print("[red]No configuration folders found[/red]")
             return
@@ -169,11 +146,8 @@ def run(self):
             selected = config_folders[int(folder_num) - 1]
             
             # Handle "all" selection for a group
-            if ":all" in selected:
-                base_name = selected.split(":")[0]
-                group_configs = [f for f in config_folders 
-                               if f.startswith(base_name) and ":all" not in f]
-                
+            if selected.endswith(":all"):
+                group_configs = grouped[selected[:-len(":all")]]
                 for config in group_configs:
                     self.console.print(f"[cyan]Processing {config}...[/cyan]")
                     config_dir = self.config_path / config
@@ -1,19 +1,45 @@
 # Script to create image grids from dataset directories, with recursive image search
 # Run with: python script.py --config <config_name> or --config <base_name>:all
+# Pillow-SIMD is preferred over stock Pillow when available (same PIL API, faster LANCZOS resampling)
 
 import argparse
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from typing import TYPE_CHECKING
 import sys
 import json
 import math
 
+# PIL is imported where it is first used, so argument parsing (--help, bad
+# arguments) doesn't pay for loading it
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Works both as part of the tools package and as a standalone script
+try:
+    from .grid_jpeg import encode_within_limit
+except ImportError:
+    from grid_jpeg import encode_within_limit
+
+# Compared against the text after the last dot of a lowercased file name
+IMAGE_SUFFIXES = {'jpg', 'jpeg', 'png'}
+
 class DatasetGridTool:
     def __init__(self):
+        from PIL import ImageFont
+
         self.cell_width = 512
         self.cell_height = 512
         self.title_height = 60
         self.font_size = 40
+        # Loaded once and reused for every grid of a ":all" run
+        try:
+            self._font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", self.font_size)
+        except Exception:
+            self._font = ImageFont.load_default()
 
     def get_dataset_path(self, config_dir: Path, datasets_path: Path, workspace_path: Path) -> Path:
         """Parse multidatabackend.json to get instance_data_dir, excluding mask paths"""
@@ -37,64 +63,117 @@ def get_dataset_path(self, config_dir: Path, datasets_path: Path, workspace_path
             raise
 
     def find_images_recursively(self, directory: Path) -> list:
-        """Find all images recursively, excluding /msk paths"""
+        """Find all images recursively, excluding /msk paths.
+
+        Extensions are matched case-insensitively, so .JPG/.PNG files are
+        included as well, in a single walk of the tree.
+        """
+        # Everything below a mask folder is excluded, including the root itself
+        if '/msk/' in f"{directory}/".lower():
+            return []
         images = []
-        for ext in ('*.jpg', '*.jpeg', '*.png'):
-            for img_path in directory.rglob(ext):
-                # Skip if path contains /msk/
-                if '/msk/' not in str(img_path):
-                    images.append(img_path)
-        return sorted(images)  # Sort for consistent order
+        for root, dirs, files in os.walk(directory, followlinks=False):
+            # Don't descend into mask folders at all
+            dirs[:] = [d for d in dirs if d.lower() != 'msk']
+            for name in files:
+                _, dot, suffix = name.rpartition('.')
+                if dot and suffix.lower() in IMAGE_SUFFIXES:
+                    images.append(os.path.join(root, name))
+        images.sort()  # Sort for consistent order
+        return [Path(path) for path in images]
+
+    def load_thumbnail(self, img_path: Path):
+        """Decode one image and shrink it to a grid cell; returns (image, error)."""
+        from PIL import Image
+
+        try:
+            img = Image.open(img_path)
+            # Shrink while loading so only cell-sized images are kept;
+            # draft lets libjpeg decode at a reduced scale
+            img.draft('RGB', (self.cell_width * 2, self.cell_height * 2))
+            # Flatten alpha and palettes before resampling, as convert('RGB') always did
+            if img.mode in ('P', '1') or 'A' in img.getbands():
+                img = img.convert('RGB')
+            img.thumbnail((self.cell_width, self.cell_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            return img, None
+        except Exception as e:
+            return None, e
+
+    @staticmethod
+    def probe_image(img_path: Path):
+        """Read just the image header; returns the error if it can't be identified."""
+        from PIL import Image
+
+        try:
+            with Image.open(img_path):
+                return None
+        except Exception as e:
+            return e
 
     def create_grid(self, images: list, output_path: Path, title: str):
-        pil_images = []
-        for img_path in images:
-            try:
-                img = Image.open(img_path)
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                pil_images.append(img)
-            except Exception as e:
-                print(f"Error loading {img_path}: {str(e)}")
-                continue
+        from PIL import Image, ImageDraw
 
-        if not pil_images:
-            raise ValueError("No valid images could be loaded")
+        workers = min(16, (os.cpu_count() or 1) * 2)
+        # PIL releases the GIL while decoding and resampling, so threads overlap the work
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Size the grid from a header-only pass so no decoded image is held yet
+            valid_images = []
+            for img_path, error in zip(images, executor.map(self.probe_image, images)):
+                if error is not None:
+                    print(f"Error loading {img_path}: {str(error)}")
+                else:
+                    valid_images.append(img_path)
 
-        n = len(pil_images)
-        cols = math.ceil(math.sqrt(n))
-        rows = math.ceil(n / cols)
+            if not valid_images:
+                raise ValueError("No valid images could be loaded")
 
-        grid = Image.new('RGB', 
-                        (cols * self.cell_width, rows * self.cell_height + self.title_height),
-                        'white')
+            n = len(valid_images)
+            cols = math.ceil(math.sqrt(n))
+            rows = math.ceil(n / cols)
 
-        for idx, img in enumerate(pil_images):
-            row = idx // cols
-            col = idx % cols
-            img.thumbnail((self.cell_width, self.cell_height), Image.Resampling.LANCZOS)
-            
-            x = col * self.cell_width
-            y = row * self.cell_height + self.title_height
-            grid.paste(img, (x, y))
+            grid = Image.new('RGB', 
+                            (cols * self.cell_width, rows * self.cell_height + self.title_height),
+                            'white')
+
+            # Keep a bounded window of loads in flight and paste/release each
+            # thumbnail as soon as it is ready, so memory doesn't grow with n
+            pasted = 0
+            paths = iter(valid_images)
+            pending = deque((img_path, executor.submit(self.load_thumbnail, img_path))
+                            for img_path in islice(paths, 2 * workers))
+            while pending:
+                img_path, future = pending.popleft()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending.append((next_path, executor.submit(self.load_thumbnail, next_path)))
+
+                img, error = future.result()
+                if error is not None:
+                    print(f"Error loading {img_path}: {str(error)}")
+                    continue
+
+                row, col = divmod(pasted, cols)
+                x = col * self.cell_width
+                y = row * self.cell_height + self.title_height
+                grid.paste(img, (x, y))
+                img.close()
+                pasted += 1
+
+        if not pasted:
+            raise ValueError("No valid images could be loaded")
+
+        # Images that failed mid-decode leave the last rows short; drop any empty ones
+        used_rows = math.ceil(pasted / cols)
+        if used_rows < rows:
+            grid = grid.crop((0, 0, grid.width, used_rows * self.cell_height + self.title_height))
 
         draw = ImageDraw.Draw(grid)
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", self.font_size)
-        except:
-            font = ImageFont.load_default()
-        
         draw.text((grid.width//2, self.title_height//2), title, 
-                  fill='black', font=font, anchor="mm")
-
-        quality = 95
-        while True:
-            test_path = output_path.with_suffix('.tmp.jpg')
-            grid.save(test_path, 'JPEG', quality=quality)
-            if test_path.stat().st_size <= 15_000_000 or quality <= 30:
-                test_path.rename(output_path)
-                break
-            quality -= 5
+                  fill='black', font=self._font, anchor="mm")
+
+        output_path.write_bytes(encode_within_limit(grid))
             
         print(f"Grid saved to: {output_path}")
         return True
@@ -114,6 +193,8 @@ def create_dataset_grid(workspace_path: str, config_name: str):
     
     tool = DatasetGridTool()
     success = True
+    # Configs often share a dataset; walk each dataset tree only once per run
+    images_by_dataset = {}
     
     for config in configs:
         try:
@@ -130,7 +211,9 @@ def create_dataset_grid(workspace_path: str, config_name: str):
                 success = False
                 continue
             
-            images = tool.find_images_recursively(dataset_dir)
+            images = images_by_dataset.get(dataset_dir)
+            if images is None:
+                images = images_by_dataset[dataset_dir] = tool.find_images_recursively(dataset_dir)
             if not images:
                 print(f"No images found in dataset directory: {dataset_dir}")
                 success = False
@@ -1,4 +1,6 @@
 import os
+import codecs
+import shutil
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -18,7 +20,8 @@ def __init__(self):
         
     def clear_screen(self):
         """Clear terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Rich writes the escape sequence itself; no clear/cls subprocess
+        self.console.clear()
         
     def verify_paths(self) -> bool:
         """Verify that required paths exist."""
@@ -40,24 +43,6 @@ def verify_paths(self) -> bool:
             
         return True
 
-    def show_progress(self, description: str, progress_task=None) -> None:
-        """Show a progress bar with the given description."""
-        if progress_task:
-            progress_task.update(description=description)
-        else:
-            with Progress(
-                TextColumn("[bold blue]{task.description}"),
-                BarColumn(complete_style="green"),
-                TaskProgressColumn(),
-                console=self.console,
-                transient=True
-            ) as progress:
-                task = progress.add_task(description, total=100)
-                while not progress.finished:
-                    progress.update(task, advance=1)
-                    import time
-                    time.sleep(0.02)
-
     def list_tokens(self) -> List[str]:
         """List all configuration tokens."""
         try:
@@ -96,6 +81,22 @@ def list_tokens(self) -> List[str]:
             rprint(f"[red]Error scanning tokens: {str(e)}[/red]")
             return []
 
+    def clean_images_dir(self) -> None:
+        """Empty SimpleTuner's images directory, like `rm -rf images/*`."""
+        images_dir = self.base_path / 'images'
+        try:
+            entries = list(os.scandir(images_dir))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            # The shell glob never matched dotfiles, so leave them alone
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
     def run_debug_crops(self, token: str) -> bool:
         """Run the debug crops command with the specified token."""
         try:
@@ -122,9 +123,6 @@ def run_debug_crops(self, token: str) -> bool:
             )
             
             if confirm.lower() == 'y':
-                # Change to SimpleTuner directory
-                os.chdir(self.base_path)
-                
                 with Progress(
                     TextColumn("[bold blue]{task.description}"),
                     BarColumn(complete_style="green"),
@@ -134,40 +132,46 @@ def run_debug_crops(self, token: str) -> bool:
                 ) as progress:
                     # Clean images directory
                     task = progress.add_task("Cleaning images directory...", total=100)
-                    process = subprocess.run(
-                        clean_cmd,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
-                    
-                    if process.returncode != 0:
-                        rprint(f"[red]Error cleaning images directory: {process.stderr}[/red]")
+                    try:
+                        self.clean_images_dir()
+                    except OSError as e:
+                        rprint(f"[red]Error cleaning images directory: {str(e)}[/red]")
                         return False
                         
                     progress.update(task, completed=100)
                     
                     # Run debug command
                     task = progress.add_task("Running debug crops...", total=None)
+                    # stderr is merged into stdout so a full, unread stderr pipe can't stall the child
                     process = subprocess.Popen(
-                        debug_cmd,
-                        shell=True,
+                        ['bash', 'train.sh'],
+                        cwd=self.base_path,
+                        env={
+                            **os.environ,
+                            'SIMPLETUNER_DEBUG_IMAGE_PREP': 'true',
+                            'SIMPLETUNER_DISABLE_ACCELERATOR': 'true',
+                            'ENV': token,
+                        },
                         stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True
+                        stderr=subprocess.STDOUT
                     )
                     
-                    # Show output in real-time
+                    # Show output in real-time, a chunk of complete lines at a time and
+                    # without markup parsing (log lines often contain [brackets])
                     rprint("\n[cyan]Debug Output:[/cyan]")
+                    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+                    partial = ''
+                    fd = process.stdout.fileno()
                     while True:
-                        output = process.stdout.readline()
-                        if output == '' and process.poll() is not None:
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
                             break
-                        if output:
-                            rprint(f"[white]{output.strip()}[/white]")
+                        lines, newline, partial = (partial + decoder.decode(chunk)).rpartition('\n')
+                        if newline:
+                            self.console.print(lines, markup=False, highlight=False)
+                    partial += decoder.decode(b'', final=True)
+                    if partial:
+                        self.console.print(partial, markup=False, highlight=False)
                     
                     # Get final return code
                     return_code = process.wait()
@@ -177,8 +181,7 @@ def run_debug_crops(self, token: str) -> bool:
                         rprint("[cyan]Check the 'images' directory for results.[/cyan]")
                         return True
                     else:
-                        stderr = process.stderr.read()
-                        rprint(f"\n[red]Error during debug crops: {stderr}[/red]")
+                        rprint(f"\n[red]Error during debug crops: exit code {return_code} (see output above)[/red]")
                         return False
             else:
                 rprint("[yellow]Operation cancelled[/yellow]")
@@ -1,10 +1,9 @@
 import os
 import sys
-import shutil
 from pathlib import Path
 from typing import List, Dict, Optional
 from rich.console import Console
-from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
+from rich.progress import Progress, TextColumn, BarColumn
 from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
@@ -32,7 +31,8 @@ def __init__(self):
         
     def clear_screen(self):
         """Clear terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Rich writes the escape sequence itself; no clear/cls subprocess
+        self.console.clear()
         
     def getch(self) -> str:
         """Get a single character from the user."""
@@ -64,14 +64,17 @@ def list_model_dirs(self) -> Dict[str, List[str]]:
                 self.console.print("[red]Output directory does not exist![/red]")
                 return {}
                 
-            for family_dir in self.base_path.iterdir():
-                if family_dir.is_dir():
-                    versions = []
-                    for version_dir in family_dir.iterdir():
-                        if version_dir.is_dir():
-                            versions.append(version_dir.name)
+            # DirEntry.is_dir() answers from the readdir entry type, so only
+            # symlinks cost an extra stat
+            with os.scandir(self.base_path) as families:
+                for family_entry in families:
+                    if not family_entry.is_dir():
+                        continue
+                    with os.scandir(family_entry.path) as version_entries:
+                        versions = [entry.name for entry in version_entries if entry.is_dir()]
                     if versions:
-                        model_families[family_dir.name] = sorted(versions, reverse=True)
+                        versions.sort(reverse=True)
+                        model_families[family_entry.name] = versions
             
             return model_families
             
@@ -126,22 +129,38 @@ def delete_model(self, family: str, version: Optional[str] = None) -> bool:
                 self.console.print(f"[red]Path does not exist: {target_path}[/red]")
                 return False
             
-            # Count items to delete for progress bar
-            total_items = sum(1 for _ in target_path.rglob('*')) + 1
-            
             # Show what we're about to delete
             self.console.print(f"\n[cyan]Deleting:[/cyan] [yellow]{target_path.relative_to(self.base_path)}[/yellow]")
             
-            # Delete with progress bar
+            # Delete bottom-up in a single walk; the total isn't known up front,
+            # so the bar pulses and the count of removed entries is shown instead
             with Progress(
                 TextColumn("[bold blue]{task.description}"),
                 BarColumn(complete_style="green"),
-                TaskProgressColumn(),
+                TextColumn("{task.completed} removed"),
                 console=self.console,
                 transient=True
             ) as progress:
-                task = progress.add_task(f"Deleting {target_path.name}...", total=total_items)
-                shutil.rmtree(target_path, onerror=lambda f, p, e: progress.advance(task))
+                task = progress.add_task(f"Deleting {target_path.name}...", total=None)
+                # A symlinked model dir only loses the link, never the files it points at
+                if os.path.islink(target_path):
+                    os.unlink(target_path)
+                    progress.advance(task)
+                else:
+                    for root, dirs, files in os.walk(target_path, topdown=False, onerror=self._raise_walk_error):
+                        for name in files:
+                            os.unlink(os.path.join(root, name))
+                            progress.advance(task)
+                        for name in dirs:
+                            path = os.path.join(root, name)
+                            # Symlinked directories are listed here but not walked into
+                            if os.path.islink(path):
+                                os.unlink(path)
+                            else:
+                                os.rmdir(path)
+                            progress.advance(task)
+                    os.rmdir(target_path)
+                    progress.advance(task)
                 
             self.console.print(f"[green]Successfully deleted {target_path.relative_to(self.base_path)}![/green]")
             return True
@@ -150,6 +169,11 @@ def delete_model(self, family: str, version: Optional[str] = None) -> bool:
             self.console.print(f"[red]Error during deletion: {str(e)}[/red]")
             return False
 
+    @staticmethod
+    def _raise_walk_error(error: OSError):
+        """Abort the delete on unreadable directories instead of skipping them."""
+        raise error
+
     def run(self):
         """Main execution method."""
         if not self.verify_paths():
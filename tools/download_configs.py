@@ -1,5 +1,7 @@
 import os
+import re
 import subprocess
+import tempfile
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from rich.console import Console
@@ -8,20 +10,26 @@
 from rich.columns import Columns
 from rich import print as rprint
 
+DIGIT_PATTERN = re.compile(r'\d')
+
 class Tool:
     def __init__(self):
         self.console = Console()
         self.base_path = Path('/workspace/SimpleTuner/config')
         self.dropbox_base = "dbx:/studio/ai/data/1models"
         self.excluded_dirs = {'.ipynb_checkpoints', 'templates'}
+        # Top-level Dropbox folders, listed once per session (the connectivity
+        # check in verify_paths fills it), and the folder matched per base name
+        self._dropbox_folders: Optional[List[str]] = None
+        self._folder_cache: Dict[str, Optional[str]] = {}
 
     def verify_paths(self) -> bool:
         if not self.base_path.exists():
             rprint(f"[red]Error: Base config directory not found at {self.base_path}[/red]")
             return False
         try:
-            result = self._run_rclone_command(["lsf", self.dropbox_base])
-            if not result:
+            # One directory-level listing proves access and is reused for folder matching
+            if self._list_dropbox_folders() is None:
                 return False
         except Exception as e:
             rprint(f"[red]Error checking Dropbox access: {str(e)}[/red]")
@@ -31,66 +39,82 @@ def verify_paths(self) -> bool:
     def _run_rclone_command(self, args: List[str], check_output: bool = True) -> Optional[str]:
         try:
             cmd = ["rclone"] + args
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Capture bytes and decode only the output a caller actually reads
+            result = subprocess.run(cmd, capture_output=True)
             if result.returncode != 0:
-                rprint(f"[red]Rclone command failed: {result.stderr}[/red]")
+                stderr = result.stderr.decode('utf-8', errors='replace')
+                rprint(f"[red]Rclone command failed: {stderr}[/red]")
                 return None
-            return result.stdout if check_output else ""
+            return result.stdout.decode('utf-8', errors='replace') if check_output else ""
         except Exception as e:
             rprint(f"[red]Error running rclone command: {str(e)}[/red]")
             return None
 
-    def find_matching_dropbox_folder(self, base_name: str) -> Optional[str]:
+    def _list_dropbox_folders(self) -> Optional[List[str]]:
+        if self._dropbox_folders is not None:
+            return self._dropbox_folders
+
         result = self._run_rclone_command([
             "lsf", self.dropbox_base,
             "--dirs-only",
-            "-R",
             "--max-depth", "1"
         ])
-        
-        if not result:
+        if result is None:
             return None
 
-        matches = []
-        for folder in result.splitlines():
-            folder = folder.strip('/')
-            if not folder:
-                continue
-                
-            score = 0
-            folder_lower = folder.lower()
-            base_name_lower = base_name.lower()
-            
-            if base_name_lower in folder_lower:
-                score += 10
-                if any(c.isdigit() for c in folder):
-                    score += 5
-                matches.append((score, folder))
+        self._dropbox_folders = [f.strip('/') for f in result.splitlines() if f.strip('/')]
+        return self._dropbox_folders
+
+    def find_matching_dropbox_folder(self, base_name: str) -> Optional[str]:
+        cache_key = base_name.lower()
+        if cache_key in self._folder_cache:
+            return self._folder_cache[cache_key]
+
+        folders = self._list_dropbox_folders()
+        if folders is None:
+            return None
+
+        # Folders containing the base name score 10, plus 5 if they carry a digit;
+        # the best is the highest score, then the shortest name
+        matches = [(15 if DIGIT_PATTERN.search(folder) else 10, folder)
+                   for folder in folders if cache_key in folder.lower()]
 
         if matches:
-            matches.sort(key=lambda x: (-x[0], len(x[1])))
-            best_match = matches[0][1]
+            best_match = min(matches, key=lambda x: (-x[0], len(x[1])))[1]
             rprint(f"[cyan]Found matching Dropbox folder: {best_match}[/cyan]")
+            self._folder_cache[cache_key] = best_match
             return best_match
             
         rprint(f"[yellow]No matching Dropbox folder found for {base_name}[/yellow]")
+        # A failed listing returns above and is retried next time; "no match" is remembered
+        self._folder_cache[cache_key] = None
         return None
 
-    def download_config(self, source_path: Path, base_name: str) -> bool:
+    def _resolve_folder(self, base_name: str) -> Optional[str]:
+        """Find the Dropbox config folder for a base name and make sure it exists."""
         dropbox_folder = self.find_matching_dropbox_folder(base_name)
         if not dropbox_folder:
-            return False
-
-        dest_path = f"{self.dropbox_base}/{dropbox_folder}/4training/config/{source_path.name}"
-        dest_path = dest_path.replace('//', '/')
+            return None
 
+        dest_dir = f"{self.dropbox_base}/{dropbox_folder}/4training/config"
         mkdir_result = self._run_rclone_command([
             "mkdir",
-            f"{self.dropbox_base}/{dropbox_folder}/4training/config"
+            dest_dir
         ], check_output=False)
         
         if mkdir_result is None:
+            return None
+        return dest_dir
+
+    def download_config(self, source_path: Path, base_name: str) -> bool:
+        dest_dir = self._resolve_folder(base_name)
+        if not dest_dir:
             return False
+        return self._copy_one(source_path, dest_dir)
+
+    def _copy_one(self, source_path: Path, dest_dir: str) -> bool:
+        dest_path = f"{dest_dir}/{source_path.name}"
+        dest_path = dest_path.replace('//', '/')
 
         rprint(f"[cyan]Copying {source_path.name} to {dest_path}[/cyan]")
         copy_result = self._run_rclone_command([
@@ -109,8 +133,9 @@ def download_config(self, source_path: Path, base_name: str) -> bool:
         return False
 
     def download_config_group(self, base_name: str) -> bool:
-        dropbox_folder = self.find_matching_dropbox_folder(base_name)
-        if not dropbox_folder:
+        # Resolve and create the destination once for the whole group
+        dest_dir = self._resolve_folder(base_name)
+        if not dest_dir:
             return False
 
         configs = list(self.base_path.glob(f"{base_name}-*"))
@@ -118,20 +143,56 @@ def download_config_group(self, base_name: str) -> bool:
             rprint(f"[yellow]No configs found matching {base_name}[/yellow]")
             return False
 
-        success = True
+        if not self._copy_many(configs, dest_dir):
+            rprint(f"[red]Failed to download {base_name} configs[/red]")
+            return False
+        return True
+
+    def _copy_many(self, configs: List[Path], dest_dir: str) -> bool:
+        """Copy several configs with one rclone process via --files-from."""
+        # --files-from takes files, not folders, so list every file under each
+        # config relative to base_path, skipping notebook checkpoints
+        relative_files = []
         for config in configs:
-            if not self.download_config(config, base_name):
-                success = False
-                rprint(f"[red]Failed to download {config.name}[/red]")
+            if not config.is_dir():
+                relative_files.append(config.name)
+                continue
+            for root, dirs, files in os.walk(config):
+                dirs[:] = [d for d in dirs if d != '.ipynb_checkpoints']
+                rel_root = os.path.relpath(root, self.base_path)
+                relative_files.extend(os.path.join(rel_root, name) for name in files)
 
-        return success
+        dest_dir = dest_dir.replace('//', '/')
+        names = ", ".join(sorted(config.name for config in configs))
+        rprint(f"[cyan]Copying {names} to {dest_dir}[/cyan]")
+        with tempfile.NamedTemporaryFile('w', prefix='rclone-files-', suffix='.txt') as files_from:
+            files_from.write("\n".join(relative_files) + "\n")
+            files_from.flush()
+            copy_result = self._run_rclone_command([
+                "copy",
+                "--files-from", files_from.name,
+                "--checksum",
+                "--transfers", "8",
+                "--checkers", "16",
+                str(self.base_path),
+                dest_dir,
+                "-v",
+                "--progress"
+            ], check_output=False)
+
+        if copy_result is not None:
+            rprint(f"[green]Successfully downloaded {names}[/green]")
+            return True
+        return False
 
     def get_config_dirs(self) -> List[Path]:
         try:
-            return [
-                d for d in self.base_path.iterdir()
-                if d.is_dir() and d.name not in self.excluded_dirs
-            ]
+            # DirEntry.is_dir() answers from the readdir entry type, no stat per entry
+            with os.scandir(self.base_path) as entries:
+                return [
+                    Path(entry.path) for entry in entries
+                    if entry.is_dir() and entry.name not in self.excluded_dirs
+                ]
         except Exception as e:
             rprint(f"[red]Error scanning config directory: {str(e)}[/red]")
             return []
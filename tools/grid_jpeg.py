@@ -0,0 +1,55 @@
+# /workspace/file-scripts/tools/grid_jpeg.py
+# JPEG output settings and size-capped encoding shared by the grid tools
+
+import io
+
+# Dataset grids are re-encoded at lower quality until they fit this size
+MAX_GRID_BYTES = 15_000_000
+MIN_QUALITY = 30
+# 4:2:0 chroma with optimized Huffman tables and progressive scans
+JPEG_SAVE_OPTIONS = {'optimize': True, 'progressive': True, 'subsampling': 2}
+
+def encode_jpeg(image, quality: int) -> bytes:
+    """Encode a PIL image as JPEG bytes with the shared save options."""
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=quality, **JPEG_SAVE_OPTIONS)
+    return buffer.getvalue()
+
+def encode_within_limit(image, max_bytes: int = MAX_GRID_BYTES) -> bytes:
+    """Encode at quality 95, or at the highest quality found that fits max_bytes.
+
+    After the first encode, the next quality is estimated from how far over the
+    limit it was (size grows roughly with the square of quality in this range).
+    The search then bisects between the bracketing qualities, instead of stepping
+    down by 5 with a full encode each time. That is at most four encodes: two
+    bisection steps when the estimate fits, or one plus the MIN_QUALITY fallback
+    when it doesn't.
+    """
+    data = encode_jpeg(image, 95)
+    if len(data) <= max_bytes:
+        return data
+
+    quality = max(MIN_QUALITY, int(95 * (max_bytes / len(data)) ** 0.5))
+    data = encode_jpeg(image, quality)
+    if len(data) <= max_bytes:
+        low, high, best = quality, 95, data
+        steps = 2
+    elif quality == MIN_QUALITY:
+        return data
+    else:
+        # The MIN_QUALITY fallback may still be needed, so keep one encode for it
+        low, high, best = MIN_QUALITY, quality, None
+        steps = 1
+
+    for _ in range(steps):
+        mid = (low + high) // 2
+        if mid == low:
+            break
+        data = encode_jpeg(image, mid)
+        if len(data) <= max_bytes:
+            low, best = mid, data
+        else:
+            high = mid
+
+    # Like the old step-down loop, the minimum quality is accepted regardless of size
+    return best if best is not None else encode_jpeg(image, MIN_QUALITY)
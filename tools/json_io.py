@@ -0,0 +1,30 @@
+# /workspace/file-scripts/tools/json_io.py
+# JSON parsing and file writing shared by the tools
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file in a single read, using orjson when available."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+def write_json(path: Path, obj: Any) -> None:
+    """Serialize obj to path in a single write.
+
+    Always uses the stdlib encoder, so the saved layout (4-space indent,
+    escaped non-ASCII) is the same whether or not orjson is installed.
+    """
+    path.write_text(json.dumps(obj, indent=4), encoding='utf-8')
@@ -1,6 +1,7 @@
 #  copy dbx not working double... 20250130 ...
 
 import os
+import json
 import shutil
 import time
 import subprocess
@@ -37,20 +38,6 @@ def verify_paths(self) -> bool:
         self.destination_base.mkdir(parents=True, exist_ok=True)
         return True
 
-    def show_progress(self, description: str, file_count: int) -> None:
-        """Show a progress bar with the given description."""
-        with Progress(
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(complete_style="green"),
-            TaskProgressColumn(),
-            console=self.console,
-            transient=True
-        ) as progress:
-            task = progress.add_task(description, total=file_count)
-            while not progress.finished:
-                progress.update(task, advance=1)
-                time.sleep(0.02)
-
     def list_model_paths(self) -> List[str]:
         """Scan current directory for model paths and display them in a formatted table."""
         try:
@@ -172,7 +159,8 @@ def sync_to_dropbox(self, model_path: str, is_single_version: bool = False) -> N
                 
             rprint(f"[yellow]Found {len(files_to_transfer)} files to process[/yellow]")
             
-            # Run transfer with simpler progress tracking
+            # Run transfer; rclone logs its transfer stats as JSON lines every second,
+            # which drive the progress bar directly
             cmd = [
                 "rclone",
                 "copy",
@@ -180,7 +168,10 @@ def sync_to_dropbox(self, model_path: str, is_single_version: bool = False) -> N
                 source_path,
                 destination,
                 "--ignore-existing",
-                "-P"
+                "--fast-list",
+                "--use-json-log",
+                "--stats", "1s",
+                "--stats-log-level", "NOTICE"
             ]
             
             with Progress(
@@ -199,12 +190,27 @@ def sync_to_dropbox(self, model_path: str, is_single_version: bool = False) -> N
                     universal_newlines=True
                 )
                 
-                # Update progress in chunks
-                for _ in range(100):
-                    if process.poll() is not None:
-                        break
-                    progress.update(task, advance=1)
-                    time.sleep(0.1)
+                # Block on rclone's output instead of polling; this also keeps the
+                # pipe drained so rclone never stalls on a full buffer
+                errors = []
+                try:
+                    for line in process.stdout:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        if not isinstance(entry, dict):
+                            continue
+                        stats = entry.get("stats")
+                        if stats and stats.get("totalBytes"):
+                            progress.update(task, completed=100 * stats["bytes"] / stats["totalBytes"])
+                        elif entry.get("level") == "error":
+                            errors.append(entry.get("msg", "").strip())
+                except BaseException:
+                    # Nothing is draining the pipe any more, so don't leave rclone behind
+                    process.kill()
+                    process.wait()
+                    raise
                 
                 # Ensure process completes
                 process.wait()
@@ -214,6 +220,8 @@ def sync_to_dropbox(self, model_path: str, is_single_version: bool = False) -> N
                     rprint("\n[green]Dropbox synchronization completed successfully![/green]")
                 else:
                     rprint("\n[red]Error during Dropbox synchronization[/red]")
+                    for message in errors:
+                        self.console.print(message, style="red", markup=False)
                     
         except Exception as e:
             rprint(f"[red]Error during Dropbox sync: {str(e)}[/red]")
@@ -311,7 +319,6 @@ def process_single_version(self):
         files_processed = self.process_safetensors(source_path, dest_path, 
                                                  selected_model, selected_version)
         if files_processed > 0:
-            self.show_progress("Processing complete", 100)
             rprint(f"[green]Successfully processed {files_processed} files![/green]")
             
             # Sync to Dropbox - for single version, we use the full path including version
@@ -356,7 +363,6 @@ def process_all_versions(self):
             total_processed += files_processed
         
         if total_processed > 0:
-            self.show_progress("Processing complete", 100)
             rprint(f"[green]Successfully processed {total_processed} files across all versions![/green]")
             
             # Sync to Dropbox - for all versions, we sync the entire model directory
@@ -17,6 +17,8 @@ def __init__(self):
         self.console = Console()
         self.base_path = Path('/workspace/ComfyUI/models/loras/flux')
         self.dropbox_path = "dbx:/studio/ai/libs/diffusion-models/models/loras/flux"
+        # Piped/scripted runs get a plain numbered list instead of panels
+        self.interactive = self.console.is_terminal
 
     def verify_paths(self) -> bool:
         """Verify that required paths exist and Dropbox is accessible."""
@@ -81,6 +83,8 @@ def _display_items_in_panels(self, items: List[str], title: str) -> List[str]:
             
             model_name = title.split("for ")[-1]
             ordered_items = sorted(items, key=str.lower, reverse=True)
+            if not self.interactive:
+                return self._print_plain(ordered_items)
             
             for idx, item in enumerate(ordered_items, 1):
                 table.add_row(f"[yellow]{idx}. {item}[/yellow]")
@@ -91,23 +95,27 @@ def _display_items_in_panels(self, items: List[str], title: str) -> List[str]:
             self.console.print(Columns(panels, equal=True, expand=True))
             return ordered_items
         else:
-            # Group families by name
+            # Group families by name; the plain list and the panels both walk these groups
             grouped = {}
             for item in sorted(items):
                 base_name = item.split('-', 1)[0]
                 grouped.setdefault(base_name, []).append(item)
+            groups = [(base_name, sorted(grouped[base_name], key=str.lower))
+                      for base_name in sorted(grouped)]
+            ordered_items = [item for _, names in groups for item in names]
+
+            if not self.interactive:
+                return self._print_plain(ordered_items)
 
             panels = []
-            ordered_items = []
             index = 1
 
-            for base_name in sorted(grouped.keys()):
+            for base_name, names in groups:
                 table = Table(show_header=False, show_edge=False, box=None, padding=(0,1))
                 table.add_column(justify="left", max_width=30)
                 
-                for item in sorted(grouped[base_name], key=str.lower):
+                for item in names:
                     table.add_row(f"[yellow]{index}. {item}[/yellow]")
-                    ordered_items.append(item)
                     index += 1
 
                 panels.append(Panel(table, title=f"[magenta]{base_name}[/magenta]", 
@@ -122,6 +130,12 @@ def _display_items_in_panels(self, items: List[str], title: str) -> List[str]:
 
             return ordered_items
 
+    def _print_plain(self, ordered_items: List[str]) -> List[str]:
+        """Print items as a plain numbered list."""
+        for idx, item in enumerate(ordered_items, 1):
+            print(f"{idx}. {item}")
+        return ordered_items
+
     def sync_to_dropbox(self, path: str) -> bool:
         """Sync a model family or version to Dropbox."""
         try:
@@ -135,6 +149,7 @@ def sync_to_dropbox(self, path: str) -> bool:
                 "rclone",
                 "sync",
                 "--progress",
+                "--fast-list",
                 source,
                 destination
             ]
@@ -4,6 +4,8 @@
 from rich.console import Console
 from safetensors import safe_open, serialize_file
 
+from .json_io import read_json
+
 class MetadataHandler:
     def __init__(self):
         self.console = Console()
@@ -16,8 +18,7 @@ def _load_json_file(self, filepath: Path) -> Optional[Dict[str, Any]]:
                 self.console.print(f"[yellow]Warning: File not found: {filepath}[/yellow]")
                 return None
                 
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return read_json(filepath)
         except Exception as e:
             self.console.print(f"[yellow]Warning: Failed to load {filepath.name}: {str(e)}[/yellow]")
             return None
@@ -33,14 +33,17 @@ def list_token_paths(self) -> tuple[List[str], Dict[str, List[str]]]:
             token_paths = []
             # First check if direct paths exist, excluding specific directories
             excluded_dirs = ['.ipynb_checkpoints', 'templates']
-            direct_tokens = [f.name for f in self.base_path.iterdir() 
-                           if f.is_dir() and f.name not in excluded_dirs]
+            # DirEntry.is_dir() answers from the readdir entry type, no stat per entry
+            with os.scandir(self.base_path) as entries:
+                direct_tokens = [entry.name for entry in entries
+                                 if entry.is_dir() and entry.name not in excluded_dirs]
             
             # Then check inside 'lora' directory if it exists
             lora_path = self.base_path / 'lora'
             if lora_path.exists():
-                token_paths.extend([f.name for f in lora_path.iterdir() 
-                                  if f.is_dir() and f.name not in excluded_dirs])
+                with os.scandir(lora_path) as entries:
+                    token_paths.extend([entry.name for entry in entries
+                                        if entry.is_dir() and entry.name not in excluded_dirs])
             
             token_paths.extend(direct_tokens)
             
@@ -48,9 +51,10 @@ def list_token_paths(self) -> tuple[List[str], Dict[str, List[str]]]:
                 rprint("[yellow]No token paths found in config directory[/yellow]")
                 return [], {}
             
-            # Group tokens by base name
+            # Group tokens by base name; sorting once up front leaves every
+            # group already in display order
             grouped = {}
-            for token in sorted(token_paths):
+            for token in sorted(token_paths, key=str.lower, reverse=True):
                 base_name = token.split('-')[0]
                 if base_name != 'templates':  # Extra check to ensure templates don't get included
                     grouped.setdefault(base_name, []).append(token)
@@ -59,22 +63,22 @@ def list_token_paths(self) -> tuple[List[str], Dict[str, List[str]]]:
             token_indices = {}
             index = 1
             ordered_tokens = []
+            base_names = sorted(grouped)
             
-            for base_name in sorted(grouped.keys()):
+            for base_name in base_names:
                 token_indices[base_name] = {}
-                for name in sorted(grouped[base_name], key=str.lower, reverse=True):
+                for name in grouped[base_name]:
                     token_indices[base_name][name] = index
                     ordered_tokens.append(name)
                     index += 1
             
             # Create panels for each group
             panels = []
-            for base_name in sorted(grouped.keys()):
+            for base_name in base_names:
                 table = Table(show_header=False, show_edge=False, box=None, padding=(0,1))
                 table.add_column(justify="left", no_wrap=False, overflow='fold', max_width=30)
                 
-                names_in_group = sorted(grouped[base_name], key=str.lower, reverse=True)
-                for name in names_in_group:
+                for name in grouped[base_name]:
                     idx = token_indices[base_name][name]
                     table.add_row(f"[yellow]{idx}. {name}[/yellow]")
                 
@@ -20,6 +20,11 @@
 from rich.prompt import Prompt
 from rich.columns import Columns
 
+from .json_io import write_json
+
+# Sentinel for config lookups where None is a legitimate stored value
+_MISSING = object()
+
 @contextmanager
 def raw_mode(file):
     """Context manager for handling raw terminal input"""
@@ -40,6 +45,7 @@ def __init__(self):
         self.base_path = Path(__file__).parent.parent
         self.library_path = self.base_path / 'config' / 'set_config_lib.json'
         self.parameters: Dict[str, Dict] = {}
+        self._index: Dict[str, Any] = {}
         self.load_parameter_library()
     
     def load_parameter_library(self) -> None:
@@ -54,15 +60,18 @@ def load_parameter_library(self) -> None:
                 self.parameters = raw_data
         except Exception as e:
             raise RuntimeError(f"Failed to load parameter library: {str(e)}")
+
+        # Flatten categories into a single lookup keyed by bare parameter name
+        self._index = {}
+        for params in self.parameters.values():
+            for key, definition in params.items():
+                self._index.setdefault(key.lstrip('-'), definition)
     
     def get_parameter_definition(self, param_key: str) -> Dict:
-        key = param_key.lstrip('-')
-        for category, params in self.parameters.items():
-            if key in params:
-                return params[key]
-            if f"--{key}" in params:
-                return params[f"--{key}"]
-        raise KeyError(f"Parameter not found in library: {param_key}")
+        try:
+            return self._index[param_key.lstrip('-')]
+        except KeyError:
+            raise KeyError(f"Parameter not found in library: {param_key}")
 
 class ParameterSelector:
     def __init__(self):
@@ -319,11 +328,9 @@ def edit_config(self, config_path: Path) -> None:
                     config_key = param['config_key']
                     key_without_dashes = config_key.lstrip('-')
                     
-                    value = None
-                    if config_key in config:
-                        value = config[config_key]
-                    elif key_without_dashes in config:
-                        value = config[key_without_dashes]
+                    value = config.get(config_key, _MISSING)
+                    if value is _MISSING:
+                        value = config.get(key_without_dashes)
                     
                     if value is not None:
                         if isinstance(value, bool):
@@ -404,8 +411,7 @@ def save_changes(self, config_path: Path) -> None:
 
             # Write updated config back to file
             try:
-                with open(config_path, 'w') as f:
-                    json.dump(config, f, indent=4)
+                write_json(config_path, config)
                 self.console.print("[green]Config saved successfully![/green]")
             except OSError as e:
                 self.console.print(f"[red]Failed to save config: {str(e)}[/red]")
@@ -471,8 +477,7 @@ def edit_config_family(self, new_folder_name: str, config_path: Path):
 
         # Save the updated config back to the file
         try:
-            with open(config_path, 'w') as file:
-                json.dump(config, file, indent=4)
+            write_json(config_path, config)
             print(f"Config updated successfully: {config_path}")
         except Exception as e:
             print(f"Failed to save updated config: {e}")
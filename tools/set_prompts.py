@@ -1,6 +1,8 @@
 import os
+import re
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -13,6 +15,17 @@
 
 import tiktoken
 
+TOKEN_PLACEHOLDER_PATTERN = re.compile(r'__TOKEN_NAME__|_TOKEN_NAME_')
+
+@lru_cache(maxsize=None)
+def _literal_pattern(text: str) -> re.Pattern:
+    """Compile (and cache) a pattern matching a literal token."""
+    return re.compile(re.escape(text))
+
+def _json_escape(text: str) -> str:
+    """Return text encoded as the inside of a JSON string literal."""
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
 class Tool:
     def __init__(self):
         self.console = Console()
@@ -162,23 +175,20 @@ def display_templates(self, template_files: List[Tuple[Path, Dict[str, int]]]) -
             self.console.print(Columns(current_row, equal=True, expand=True))
 
     def process_user_prompt_library(self, filepath: Path, token_name: str, existing_token: str = None) -> None:
+        if existing_token and existing_token == token_name:
+            return
+
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            content = filepath.read_text(encoding='utf-8')
+
+            # Substitute on the raw JSON text; the replacement is JSON-escaped,
+            # so the document stays valid without a parse/serialize round-trip
+            pattern = _literal_pattern(_json_escape(existing_token)) if existing_token else TOKEN_PLACEHOLDER_PATTERN
+            replacement = _json_escape(token_name)
+            content, count = pattern.subn(lambda m: replacement, content)
 
-            updated_data = {}
-            for key, value in data.items():
-                if existing_token:
-                    new_key = key.replace(existing_token, token_name) if existing_token != token_name else key
-                    updated_data[new_key] = (
-                        value.replace(existing_token, token_name) if existing_token != token_name else value
-                    )
-                else:
-                    new_key = key.replace('__TOKEN_NAME__', token_name).replace('_TOKEN_NAME_', token_name)
-                    updated_data[new_key] = value.replace('__TOKEN_NAME__', token_name).replace('_TOKEN_NAME_', token_name)
-
-            with open(filepath, 'w') as f:
-                json.dump(updated_data, f, indent=2)
+            if count:
+                filepath.write_text(content, encoding='utf-8')
                 
         except Exception as e:
             rprint(f"[red]Error processing user_prompt_library.json: {str(e)}[/red]")
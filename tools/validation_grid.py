@@ -10,6 +10,8 @@
 from rich.panel import Panel
 from time import sleep
 
+from .grid_jpeg import JPEG_SAVE_OPTIONS
+
 class Tool:
     def __init__(self):
         print("Debug: Initializing Tool wrapper")
@@ -217,7 +219,7 @@ def save_grid(self, grid_image: Image.Image, model: str, version: str) -> bool:
             save_dir.mkdir(parents=True, exist_ok=True)
             
             output_path = save_dir / f"{model}-{version}-validation-grid.jpg"
-            grid_image.save(output_path, 'JPEG', quality=95)
+            grid_image.save(output_path, 'JPEG', quality=95, **JPEG_SAVE_OPTIONS)
             
             self.console.print(f"[green]Grid saved to: {output_path}[/green]")
             return True
@@ -9,6 +9,12 @@
 import sys
 import re
 
+# Works both as part of the tools package and as a standalone script
+try:
+    from .grid_jpeg import JPEG_SAVE_OPTIONS
+except ImportError:
+    from grid_jpeg import JPEG_SAVE_OPTIONS
+
 class ValidationGridTool:
     def __init__(self):
         # Grid layout parameters
@@ -130,7 +136,7 @@ def save_grid(self, grid_image: Image.Image, model: str, version: str, config_pa
             save_dir.mkdir(parents=True, exist_ok=True)
             
             output_path = save_dir / f"{model}-{version}-validation-grid.jpg"
-            grid_image.save(output_path, 'JPEG', quality=95)
+            grid_image.save(output_path, 'JPEG', quality=95, **JPEG_SAVE_OPTIONS)
             
             print(f"Grid saved to: {output_path}")
             return True